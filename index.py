@@ -2,27 +2,10 @@
 from __future__ import annotations
 
 import os
-import subprocess
 import sys
 from pathlib import Path
 
 
-def load_dotenv(path: Path) -> None:
-    if not path.is_file():
-        return
-    # Minimal .env parser to avoid external deps.
-    with path.open("r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-            if key and key not in os.environ:
-                os.environ[key] = value
-
-
 def check_video_tools_path() -> bool:
     thumb_path = os.environ.get("VIDEO_TOOLS_THUMBNAIL_PATH", "").strip()
     if not thumb_path:
@@ -61,6 +44,12 @@ def main(argv: list[str] | None = None) -> int:
     argv = list(sys.argv[1:] if argv is None else argv)
 
     root = Path(__file__).resolve().parent
+    scripts_dir = root / "scripts"
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    # Shared with the scripts so the parsed .env is reused in-process.
+    from _shared import load_dotenv
+
     load_dotenv(root / ".env")
 
     if not argv:
@@ -79,12 +68,14 @@ def main(argv: list[str] | None = None) -> int:
     if not check_video_tools_path():
         return 1
 
-    delegator = root / "scripts" / "delegator.py"
+    delegator = scripts_dir / "delegator.py"
     if not delegator.is_file():
         print(f"error: missing delegator script at {delegator}", file=sys.stderr)
         return 1
 
-    return subprocess.run([sys.executable, str(delegator), *argv], cwd=str(root)).returncode
+    from delegator import main as delegator_main
+
+    return delegator_main(argv)
 
 
 if __name__ == "__main__":
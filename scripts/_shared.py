@@ -7,28 +7,66 @@ import re
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Iterable
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def load_dotenv(path: Path) -> None:
-    if not path.is_file():
-        return
-    # Minimal .env parser to avoid external deps.
-    with path.open("r", encoding="utf-8") as handle:
+_DOTENV_SKIP_RE = re.compile(rb"^[ \t]*(#|\r?\n|$)")
+
+
+@lru_cache(maxsize=8)
+def _parse_dotenv(path_str: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    # mtime_ns is part of the cache key so an edited .env is re-read.
+    pairs = []
+    # Minimal .env parser to avoid external deps. Lines are scanned as bytes
+    # and only accepted key/value pairs are decoded.
+    with open(path_str, "rb") as handle:
         for raw_line in handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
+            if _DOTENV_SKIP_RE.match(raw_line):
                 continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-            if key and key not in os.environ:
-                os.environ[key] = value
+            key, sep, value = raw_line.partition(b"=")
+            if not sep:
+                continue
+            key = key.decode("utf-8").strip()
+            if key:
+                pairs.append((key, value.decode("utf-8").strip()))
+    return tuple(pairs)
+
+
+_loaded_dotenv: set[Path] = set()
+
+# Set once a .env has been applied; child processes inherit it and skip the
+# re-parse since the parsed values are already in their environment.
+DOTENV_LOADED_ENV = "_THUMBNAILS_DOTENV_LOADED"
+
+
+def load_dotenv(path: Path) -> None:
+    if os.environ.get(DOTENV_LOADED_ENV) == "1":
+        return
+    path = path.resolve()
+    if path in _loaded_dotenv:
+        return
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return
+    if not S_ISREG(stat_result.st_mode):
+        return
+    for key, value in _parse_dotenv(str(path), stat_result.st_mtime_ns):
+        os.environ.setdefault(key, value)
+    _loaded_dotenv.add(path)
+    os.environ[DOTENV_LOADED_ENV] = "1"
 
 
 def require_video_tools_path() -> Path:
@@ -57,11 +95,35 @@ def parse_video_tools_args(unknown_args: list[str]) -> list[str]:
     return unknown_args
 
 
+# Maps every byte outside [0-9a-z] to "_" so slugify can translate in one pass.
+_SLUG_TABLE = bytes.maketrans(
+    bytes(range(256)),
+    bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else ord("_") for c in range(256)),
+)
+_SLUG_DEDUP_RE = re.compile(rb"_+")
+
+
 def slugify(text: str) -> str:
-    normalized = text.strip().lower()
-    normalized = normalized.encode("ascii", "ignore").decode("ascii")
-    normalized = re.sub(r"[^a-z0-9]+", "_", normalized).strip("_")
-    return normalized or "thumbnail"
+    normalized = text.strip().lower().encode("ascii", "ignore").translate(_SLUG_TABLE)
+    normalized = _SLUG_DEDUP_RE.sub(b"_", normalized).strip(b"_")
+    return normalized.decode("ascii") or "thumbnail"
+
+
+def json_loads(data: bytes) -> object:
+    """Parse JSON straight from bytes (orjson when installed).
+
+    Decode errors are json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(payload: object) -> bytes:
+    """Serialize with a 2-space indent and trailing newline, as UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n"
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
 
 
 def utc_now() -> str:
@@ -70,6 +132,4 @@ def utc_now() -> str:
 
 def write_metadata(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, sort_keys=True)
-        handle.write("\n")
+    path.write_bytes((json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8"))
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import subprocess
+import importlib
 import sys
 from pathlib import Path
 
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
 COMMANDS = {
-    "set_thumbnail": "set_thumbnail.py",
-    "lunar_thumbnail": "lunar_thumbnail.py",
-    "event_thumbnail": "event_thumbnail.py",
+    "set_thumbnail": "set_thumbnail",
+    "lunar_thumbnail": "lunar_thumbnail",
+    "event_thumbnail": "event_thumbnail",
 }
 
 ALIASES = {
@@ -39,18 +41,34 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     command = ALIASES.get(argv[0], argv[0])
-    script_name = COMMANDS.get(command)
-    if script_name is None:
+    module_name = COMMANDS.get(command)
+    if module_name is None:
         print(f"error: unknown command '{argv[0]}'", file=sys.stderr)
         print_usage()
         return 2
 
-    script_path = Path(__file__).resolve().parent / script_name
+    script_path = SCRIPTS_DIR / f"{module_name}.py"
     if not script_path.is_file():
         print(f"error: missing script: {script_path}", file=sys.stderr)
         return 2
 
-    return subprocess.run([sys.executable, str(script_path), *argv[1:]]).returncode
+    # Run the target in-process; scripts import their siblings by bare name.
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    module = importlib.import_module(module_name)
+    # argparse derives `prog` from sys.argv[0]; point it at the script so
+    # usage/errors read the same as running it directly.
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *argv[1:]]
+    try:
+        return module.main(argv[1:])
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = saved_argv
 
 
 if __name__ == "__main__":
@@ -7,59 +7,83 @@ pipeline from set_thumbnail.py so previews are pixel-perfect.
 
 Usage:
     pip install flask          # one-time
+    pip install PyTurboJPEG    # optional: faster preview encoding
+    pip install orjson         # optional: faster JSON for config + API
     python3 scripts/editor_server.py
 """
 from __future__ import annotations
 
 import copy
+import hashlib
 import io
 import json
+import os
 import sys
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from threading import Timer
-
-from PIL import Image, ImageDraw
+from threading import Lock, Thread, Timer, get_ident
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Bootstrap project imports
 # ---------------------------------------------------------------------------
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from _shared import load_dotenv, project_root
-
-import set_thumbnail as st
+from _shared import json_dumps_pretty, json_loads, load_dotenv, project_root
 
 try:
-    from flask import Flask, Response, jsonify, render_template, request
-except ImportError:
-    print("error: flask is required (pip install flask)", file=sys.stderr)
-    raise SystemExit(1)
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
+
+# Pillow and set_thumbnail are heavy; they are bound by init() so that
+# `--help` and plain imports of this module stay cheap.
+st = None
+Image = None
+ImageDraw = None
+
+# Optional libjpeg-turbo encoder for previews, bound by init() when the
+# PyTurboJPEG package and its shared library are available.
+turbo_jpeg = None
+np = None
+TJPF_RGB = None
+TJSAMP_420 = None
 
 ROOT = project_root()
 
-# ---------------------------------------------------------------------------
-# Flask app
-# ---------------------------------------------------------------------------
-app = Flask(
-    __name__,
-    template_folder=str(Path(__file__).resolve().parent / "editor_templates"),
-    static_folder=str(Path(__file__).resolve().parent / "editor_static"),
-    static_url_path="/static",
-)
-
 # ---------------------------------------------------------------------------
 # Character list (sorted directory names from vs_screen)
 # ---------------------------------------------------------------------------
 CHARACTER_SET = "vs_screen"
 CHARACTER_DIR = ROOT / "assets" / "melee" / "characters" / CHARACTER_SET
 
-CHARACTERS: list[str] = sorted(
-    p.name for p in CHARACTER_DIR.iterdir() if p.is_dir()
-)
+# Populated by init() so importing this module doesn't touch the disk.
+CHARACTERS: list[str] = []
 
 OPPONENT = "Fox"  # fixed opponent for the other side
 
+# Rendered text overlays persist here across server restarts.  Bump the
+# version when the text drawing code changes so stale PNGs are ignored.
+TEXT_OVERLAY_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "thumbnails"
+    / "text_overlays"
+)
+TEXT_OVERLAY_CACHE_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Config I/O (orjson when installed, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+def read_config(path: Path) -> dict:
+    return json_loads(path.read_bytes())
+
+
+def write_config(path: Path, config: dict) -> None:
+    path.write_bytes(json_dumps_pretty(config))
+
 
 # ---------------------------------------------------------------------------
 # Editor state
@@ -80,7 +104,20 @@ class EditorState:
         self.dirty_pages: set[tuple[str, str]] = set()
 
         # Text overlay cache: keyed by (left_name, right_name)
-        self.text_overlay_cache: dict[tuple[str, str], Image.Image] = {}
+        self.text_overlay_cache: dict[
+            tuple[str, str], tuple[Image.Image, tuple[int, int]] | None
+        ] = {}
+
+        # Overridden + outlined opponent: keyed by its resolved override values
+        self.opp_cache: dict[tuple, tuple[Image.Image, int, int, int, int]] = {}
+
+        # (key, render_fn) specialized for the page currently being dragged
+        self.hot_closure: tuple[tuple, Callable[[float, int, int, int], bytes]] | None = None
+
+        # Render ETags: a per-process salt plus a counter bumped on every
+        # override change, so browsers revalidate instead of re-fetching.
+        self.etag_salt = os.urandom(4).hex()
+        self.render_generation = 0
 
     def rebuild_overrides(self) -> None:
         """Re-parse overrides_raw into the resolved form."""
@@ -124,27 +161,35 @@ class EditorState:
             side_block["use_other_side"] = True
         else:
             side_block.pop("use_other_side", None)
-        self.rebuild_overrides()
+        # Only this character's block changed; patch its resolved entry.
+        st.update_character_override(self.overrides, character, char_block)
         self.dirty_pages.add((character, side.lower()))
+        if character == OPPONENT:
+            self.opp_cache.clear()
+        self.hot_closure = None
+        self.render_generation += 1
+        _render_cached.cache_clear()
 
     def save_to_disk(self) -> None:
         """Write overrides_raw back into the event config JSON on disk."""
-        with self.event_config_path.open("r", encoding="utf-8") as f:
-            config = json.load(f)
-        config["character_overrides"] = copy.deepcopy(self.overrides_raw)
-        with self.event_config_path.open("w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
-            f.write("\n")
+        config = read_config(self.event_config_path)
+        # Serializing doesn't mutate, so the working copy can be written as-is.
+        config["character_overrides"] = self.overrides_raw
+        write_config(self.event_config_path, config)
         self.dirty_pages.clear()
 
     def reload_from_disk(self) -> None:
         """Discard working state and reload from disk."""
-        with self.event_config_path.open("r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = read_config(self.event_config_path)
         self.overrides_raw = copy.deepcopy(config.get("character_overrides") or {})
         self.rebuild_overrides()
         self.dirty_pages.clear()
         self.text_overlay_cache.clear()
+        st.clear_font_caches()
+        self.opp_cache.clear()
+        self.hot_closure = None
+        self.render_generation += 1
+        _render_cached.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -168,17 +213,37 @@ character_max_height: int = 0
 # Pre-loaded character images: (character_name, "Left"|"Right") -> (image, mirror_flag)
 # Images are loaded, cropped, and scaled-to-fit but NOT override-scaled yet.
 char_images: dict[tuple[str, str], Image.Image] = {}
+# Horizontally flipped variants of char_images, made on first use.
+char_images_flipped: dict[tuple[str, str], Image.Image] = {}
+
+# In-flight background loads; get_char_image() moves results into char_images.
+char_image_futures: dict[tuple[str, str], Future] = {}
+preload_executor: ThreadPoolExecutor | None = None
 
 
-def init() -> None:
-    """Load configs, base image, and pre-load all character images."""
+def init(wait: bool = False) -> None:
+    """Load configs, base image, and pre-load all character images.
+
+    With ``wait=True`` the pre-load finishes before returning.
+    """
     global state, base_image, event_config, width, height
     global scale_x, scale_y, outline_px, outline_color
     global border, margin_x, margin_y
     global character_max_width, character_max_height
+    global st, Image, ImageDraw
+    global CHARACTERS, preload_executor
+
+    import set_thumbnail as st
+    from PIL import Image, ImageDraw
+
+    _init_turbo_jpeg()
 
     load_dotenv(ROOT / ".env")
 
+    # DirEntry.is_dir() reuses the d_type from the directory read (no stat).
+    with os.scandir(CHARACTER_DIR) as entries:
+        CHARACTERS = sorted(entry.name for entry in entries if entry.is_dir())
+
     main_config = st.load_main_config(ROOT)
     event_config_path, event_config = st.resolve_event_config(ROOT, main_config)
 
@@ -191,7 +256,9 @@ def init() -> None:
         print(f"error: base image not found: {base_image_path}", file=sys.stderr)
         raise SystemExit(1)
 
-    base_image = Image.open(base_image_path).convert("RGBA")
+    # Kept as RGB: the base is opaque, and an RGB canvas can go straight to
+    # the JPEG encoder without a per-render conversion copy.
+    base_image = Image.open(base_image_path).convert("RGB")
     width, height = base_image.size
     scale_x = width / st.BASE_WIDTH
     scale_y = height / st.BASE_HEIGHT
@@ -206,227 +273,505 @@ def init() -> None:
     character_max_width = int(round(width * 0.396))
     character_max_height = int(round(height * 0.63))
 
-    # Pre-load all character images (raw per-side, no config mirroring baked in)
-    print("Pre-loading character images...")
-    for char_name in CHARACTERS:
-        for side in ("Left", "Right"):
-            try:
-                img_path, do_mirror, _ = st.resolve_character_image(
-                    CHARACTER_DIR,
-                    char_name,
-                    "Default",
-                    side,
-                    CHARACTER_SET,
-                    character_max_width,
-                    character_max_height,
-                )
-                img = st.load_character_image(img_path, do_mirror)
-                img = st.crop_transparent(img)
-                img = st.scale_to_fit(img, character_max_width, character_max_height)
-                char_images[(char_name, side)] = img
-            except RuntimeError as exc:
-                print(f"warning: failed to load {char_name} {side}: {exc}", file=sys.stderr)
-    print(f"Loaded {len(char_images)} character images.")
+    # Pre-load all character images (raw per-side, no config mirroring baked in).
+    # Each job is an independent decode + crop + resize; Pillow releases the
+    # GIL for those, so a thread pool scales across cores.
+    jobs = [(char_name, side) for char_name in CHARACTERS for side in ("Left", "Right")]
+    preload_executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2))
+    if wait:
+        print("Pre-loading character images...")
+        for job, img in zip(jobs, preload_executor.map(_load_one, jobs)):
+            if img is not None:
+                char_images[job] = img
+        print(f"Loaded {len(char_images)} character images.")
+        return
+
+    # Otherwise load in the background so the server can start accepting
+    # requests right away.
+    print("Pre-loading character images in the background...")
+    for job in jobs:
+        char_image_futures[job] = preload_executor.submit(_load_one, job)
+    Thread(target=_report_preload, daemon=True).start()
+
+
+def _init_turbo_jpeg() -> None:
+    """Bind the optional PyTurboJPEG encoder (falls back to Pillow)."""
+    global turbo_jpeg, np, TJPF_RGB, TJSAMP_420
+    try:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG
+
+        turbo_jpeg = TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        turbo_jpeg = None
+
+
+def _load_one(job: tuple[str, str]) -> Image.Image | None:
+    """Load, crop, and scale-to-fit one raw character image."""
+    char_name, side = job
+    try:
+        img_path, do_mirror, _ = st.resolve_character_image(
+            CHARACTER_DIR,
+            char_name,
+            "Default",
+            side,
+            CHARACTER_SET,
+            character_max_width,
+            character_max_height,
+        )
+        img = st.load_character_image(img_path, do_mirror)
+        return st.scale_to_fit(img, character_max_width, character_max_height)
+    except RuntimeError as exc:
+        print(f"warning: failed to load {char_name} {side}: {exc}", file=sys.stderr)
+        return None
+
 
+def _report_preload() -> None:
+    loaded = sum(1 for future in list(char_image_futures.values()) if future.result() is not None)
+    print(f"Loaded {loaded} character images.")
 
-def get_text_overlay(left_name: str, right_name: str) -> Image.Image:
-    """Render (and cache) the text overlay for given player names."""
+
+def get_char_image(key: tuple[str, str], flip: bool = False) -> Image.Image | None:
+    """Return a pre-loaded character image, waiting for its load if needed.
+
+    Images are shared and must not be mutated. Flipped variants are made once
+    and kept in char_images_flipped, so toggling flip doesn't re-copy pixels.
+    """
+    if flip:
+        flipped = char_images_flipped.get(key)
+        if flipped is None:
+            img = get_char_image(key)
+            if img is None:
+                return None
+            flipped = img.transpose(Image.FLIP_LEFT_RIGHT)
+            char_images_flipped[key] = flipped
+        return flipped
+
+    img = char_images.get(key)
+    if img is None:
+        future = char_image_futures.get(key)
+        if future is None:
+            return None
+        img = future.result()
+        if img is None:
+            return None
+        char_images[key] = img
+    return img
+
+
+text_render_lock = Lock()
+
+
+def get_text_overlay(
+    left_name: str, right_name: str,
+) -> tuple[Image.Image, tuple[int, int]] | None:
+    """Render (and cache) the text overlay for given player names.
+
+    Returns the overlay cropped to its opaque bounds plus the paste position,
+    or None when no text is drawn.
+    """
     key = (left_name, right_name)
     if key in state.text_overlay_cache:
         return state.text_overlay_cache[key]
 
-    overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
-
     text_config = event_config.get("text", {})
-    stack_y = None
-    stack_y = st.draw_text_block(
-        draw, ROOT, "event_title", text_config.get("event_title"),
-        scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
-    )
-    stack_y = st.draw_text_block(
-        draw, ROOT, "event_number", text_config.get("event_number"),
-        scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
-    )
-    stack_y = st.draw_text_block(
-        draw, ROOT, "round_title", text_config.get("round_title"),
-        scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
-    )
-    st.draw_text_block(
-        draw, ROOT, "vs_logo", text_config.get("vs_logo"),
-        scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, None,
+    digest = text_overlay_digest(text_config, left_name, right_name)
+    cache_file = TEXT_OVERLAY_CACHE_DIR / f"{digest}.png"
+    result = load_text_overlay(cache_file)
+    if result is not None:
+        state.text_overlay_cache[key] = result
+        return result
+
+    # Flask serves requests on several threads, but the cached FreeType faces
+    # behind st's font helpers aren't safe to use from two threads at once.
+    with text_render_lock:
+        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        stack_y = None
+        stack_y = st.draw_text_block(
+            draw, ROOT, "event_title", text_config.get("event_title"),
+            scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
+        )
+        stack_y = st.draw_text_block(
+            draw, ROOT, "event_number", text_config.get("event_number"),
+            scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
+        )
+        stack_y = st.draw_text_block(
+            draw, ROOT, "round_title", text_config.get("round_title"),
+            scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, stack_y,
+        )
+        st.draw_text_block(
+            draw, ROOT, "vs_logo", text_config.get("vs_logo"),
+            scale_x, scale_y, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH, None,
+        )
+        st.draw_player_names(
+            draw, ROOT, text_config.get("player_names"),
+            left_name, right_name,
+            scale_x, scale_y, width, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH,
+        )
+
+    # Text only covers a small part of the frame; keep just that region so
+    # each render blends the text bounds instead of the full image.
+    bbox = overlay.getbbox()
+    result = (overlay.crop(bbox), bbox[:2]) if bbox else None
+    state.text_overlay_cache[key] = result
+    if result is not None:
+        save_text_overlay(cache_file, *result)
+    return result
+
+
+def text_overlay_digest(text_config: dict, left_name: str, right_name: str) -> str:
+    """Hash everything that affects the rendered text overlay.
+
+    Font files are identified by path plus mtime/size so that reinstalling a
+    title font invalidates overlays drawn with the old one.
+    """
+    fonts = []
+    pending: list = [text_config]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, dict):
+            value = item.get("font_path")
+            if isinstance(value, str) and value:
+                path = st.resolve_path(ROOT, value)
+                try:
+                    stat = path.stat()
+                    fonts.append([str(path), stat.st_mtime_ns, stat.st_size])
+                except OSError:
+                    fonts.append([str(path), None, None])
+            pending.extend(item.values())
+        elif isinstance(item, list):
+            pending.extend(item)
+    payload = json.dumps(
+        [TEXT_OVERLAY_CACHE_VERSION, text_config, sorted(fonts),
+         width, height, left_name, right_name],
+        sort_keys=True,
     )
-    st.draw_player_names(
-        draw, ROOT, text_config.get("player_names"),
-        left_name, right_name,
-        scale_x, scale_y, width, st.BASE_LINE_SPACING, st.BASE_TEXT_STROKE_WIDTH,
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_text_overlay(
+    cache_file: Path,
+) -> tuple[Image.Image, tuple[int, int]] | None:
+    """Load a persisted overlay, or None if missing or unreadable."""
+    try:
+        with Image.open(cache_file) as img:
+            img.load()
+            x, y = (int(v) for v in img.info["offset"].split(","))
+            return img.convert("RGBA"), (x, y)
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_text_overlay(
+    cache_file: Path, overlay: Image.Image, pos: tuple[int, int],
+) -> None:
+    """Persist a cropped overlay; the paste position rides in a PNG text chunk."""
+    from PIL.PngImagePlugin import PngInfo
+
+    info = PngInfo()
+    info.add_text("offset", f"{pos[0]},{pos[1]}")
+    # Render requests run on Flask's threads and may miss on the same overlay
+    # at once, so each writer needs its own temp file.
+    tmp = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.{get_ident()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        overlay.save(tmp, "PNG", pnginfo=info, compress_level=1)
+        os.replace(tmp, cache_file)
+    except OSError as exc:
+        tmp.unlink(missing_ok=True)
+        print(f"Warning: could not cache text overlay: {exc}", file=sys.stderr)
+
+
+def get_opponent_image(
+    opp_side: str, opp_override: dict,
+) -> tuple[Image.Image, int, int, int, int]:
+    """Return (image, base_w, base_h, offset_x, offset_y) for the opponent.
+
+    The opponent only changes when its own override does, so the overridden
+    and outlined image is cached in state.opp_cache.
+    """
+    key = (
+        opp_side,
+        opp_override.get("scale", 1.0),
+        opp_override.get("offset_x", 0),
+        opp_override.get("raise", 0),
+        bool(opp_override.get("mirror")),
+        bool(opp_override.get("use_other_side")),
+        outline_px,
     )
+    cached = state.opp_cache.get(key)
+    if cached is not None:
+        return cached
 
-    state.text_overlay_cache[key] = overlay
-    return overlay
+    # Respect the opponent's config mirror/use_other_side too
+    if opp_override.get("use_other_side"):
+        opp_load_side = "Left" if opp_side == "Right" else "Right"
+    else:
+        opp_load_side = opp_side
+    opp_key = (OPPONENT, opp_load_side)
+    opp_img = get_char_image(opp_key, bool(opp_override.get("mirror")))
+    if opp_img is None:
+        raise RuntimeError(f"No image for {OPPONENT} {opp_load_side}")
+
+    opp_img, opp_ox, opp_oy = st.apply_character_override(opp_img, opp_override, scale_x, scale_y)
+    opp_bw, opp_bh = opp_img.width, opp_img.height
+    if outline_px > 0:
+        opp_img = st.apply_character_outline(opp_img, outline_px, outline_color)
+
+    cached = (opp_img, opp_bw, opp_bh, opp_ox, opp_oy)
+    state.opp_cache[key] = cached
+    return cached
 
 
 def render_thumbnail(
     character: str, side: str, scale: float, offset_x: int, raise_val: int,
-    flip: bool = False, use_other: bool = False,
+    flip: bool = False, use_other: bool = False, preview: bool = False,
 ) -> bytes:
-    """Render a full thumbnail JPEG with the given overrides applied to character+side."""
+    """Render a full thumbnail JPEG with the given overrides applied to character+side.
+
+    ``preview`` swaps the character resize to BILINEAR for live drags.
+    """
     side_cap = side.capitalize()
     opp_side = "Right" if side_cap == "Left" else "Left"
+    opp_sig = tuple(sorted(state.resolve(OPPONENT, opp_side).items()))
+    # Slider values are continuous; bucket scale so nearby ticks share an entry.
+    resample = Image.BILINEAR if preview else Image.LANCZOS
+    return _render_cached(
+        character, side_cap, round(scale, 3), offset_x, raise_val, flip, use_other, opp_sig,
+        resample,
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_cached(
+    character: str, side_cap: str, scale: float, offset_x: int, raise_val: int,
+    flip: bool, use_other: bool, opp_sig: tuple, resample: int,
+) -> bytes:
+    """Render and JPEG-encode one editor preview (cleared when overrides change)."""
+    # Dragging a slider only changes scale/offset_x/raise, so reuse the
+    # closure specialized for the current page while the rest stays put.
+    key = (character, side_cap, flip, use_other, opp_sig)
+    hot = state.hot_closure
+    if hot is None or hot[0] != key:
+        hot = (key, _build_render_closure(character, side_cap, flip, use_other, opp_sig))
+        state.hot_closure = hot
+    return hot[1](scale, offset_x, raise_val, resample)
+
+
+def _build_render_closure(
+    character: str, side_cap: str, flip: bool, use_other: bool, opp_sig: tuple,
+) -> Callable[[float, int, int, int], bytes]:
+    """Resolve everything that doesn't depend on the slider values once."""
+    opp_side = "Right" if side_cap == "Left" else "Left"
 
     # Editing character image — optionally swap to the other side's source
     if use_other:
         edit_key = (character, opp_side)
     else:
         edit_key = (character, side_cap)
-    if edit_key not in char_images:
+    # Flipped horizontally if requested
+    edit_src = get_char_image(edit_key, flip)
+    if edit_src is None:
         raise RuntimeError(f"No image for {edit_key[0]} {edit_key[1]}")
-    edit_img = char_images[edit_key].copy()
 
-    # Flip horizontally if requested
-    if flip:
-        edit_img = edit_img.transpose(Image.FLIP_LEFT_RIGHT)
+    # Opponent (Fox) image — overridden and outlined once per override value
+    opp_img, opp_bw, opp_bh, opp_ox, opp_oy = get_opponent_image(opp_side, dict(opp_sig))
 
-    # Opponent (Fox) image — respect its config mirror/use_other_side too
-    opp_override = state.resolve(OPPONENT, opp_side)
-    if opp_override.get("use_other_side"):
-        opp_load_side = "Left" if opp_side == "Right" else "Right"
+    offset = outline_px if outline_px > 0 else 0
+    edit_is_left = side_cap == "Left"
+
+    # Opponent position (same formula as set_thumbnail.py main())
+    if edit_is_left:
+        opp_pos = (
+            width - border - margin_x - opp_bw + opp_ox - offset,
+            height - border - margin_y - opp_bh + opp_oy - offset,
+        )
+        text_overlay = get_text_overlay(character, OPPONENT)
     else:
-        opp_load_side = opp_side
-    opp_key = (OPPONENT, opp_load_side)
-    if opp_key not in char_images:
-        raise RuntimeError(f"No image for {OPPONENT} {opp_load_side}")
-    opp_img = char_images[opp_key].copy()
-    if opp_override.get("mirror"):
-        opp_img = opp_img.transpose(Image.FLIP_LEFT_RIGHT)
+        opp_pos = (
+            border + margin_x + opp_ox - offset,
+            height - border - margin_y - opp_bh + opp_oy - offset,
+        )
+        text_overlay = get_text_overlay(OPPONENT, character)
 
-    # Apply overrides to editing character
-    edit_override = {"scale": scale, "offset_x": offset_x, "raise": raise_val}
-    edit_img, edit_ox, edit_oy = st.apply_character_override(edit_img, edit_override, scale_x, scale_y)
+    def render(scale: float, offset_x: int, raise_val: int, resample: int) -> bytes:
+        # Apply overrides to editing character
+        edit_override = {"scale": scale, "offset_x": offset_x, "raise": raise_val}
+        edit_img, edit_ox, edit_oy = st.apply_character_override(
+            edit_src, edit_override, scale_x, scale_y, resample,
+        )
+        edit_bw, edit_bh = edit_img.width, edit_img.height
+        if offset:
+            edit_img = st.apply_character_outline(edit_img, offset, outline_color)
 
-    # Apply overrides to opponent
-    opp_img, opp_ox, opp_oy = st.apply_character_override(opp_img, opp_override, scale_x, scale_y)
+        edit_y = height - border - margin_y - edit_bh + edit_oy - offset
+        if edit_is_left:
+            edit_pos = (border + margin_x + edit_ox - offset, edit_y)
+        else:
+            edit_pos = (width - border - margin_x - edit_bw + edit_ox - offset, edit_y)
 
-    # Record base dimensions before outline
-    edit_bw, edit_bh = edit_img.width, edit_img.height
-    opp_bw, opp_bh = opp_img.width, opp_img.height
+        # Composite (left character first, then right)
+        canvas = base_image.copy()
+        if edit_is_left:
+            canvas.paste(edit_img, edit_pos, edit_img)
+            canvas.paste(opp_img, opp_pos, opp_img)
+        else:
+            canvas.paste(opp_img, opp_pos, opp_img)
+            canvas.paste(edit_img, edit_pos, edit_img)
 
-    # Apply outline
-    offset = outline_px if outline_px > 0 else 0
-    if offset:
-        edit_img = st.apply_character_outline(edit_img, offset, outline_color)
-        opp_img = st.apply_character_outline(opp_img, offset, outline_color)
-
-    # Determine which is left and which is right
-    if side_cap == "Left":
-        left_img, left_bw, left_bh, left_ox, left_oy = edit_img, edit_bw, edit_bh, edit_ox, edit_oy
-        right_img, right_bw, right_bh, right_ox, right_oy = opp_img, opp_bw, opp_bh, opp_ox, opp_oy
-        left_name, right_name = character, OPPONENT
-    else:
-        left_img, left_bw, left_bh, left_ox, left_oy = opp_img, opp_bw, opp_bh, opp_ox, opp_oy
-        right_img, right_bw, right_bh, right_ox, right_oy = edit_img, edit_bw, edit_bh, edit_ox, edit_oy
-        left_name, right_name = OPPONENT, character
-
-    # Compute positions (same formula as set_thumbnail.py main())
-    left_x = border + margin_x + left_ox - offset
-    left_y = height - border - margin_y - left_bh + left_oy - offset
-    right_x = width - border - margin_x - right_bw + right_ox - offset
-    right_y = height - border - margin_y - right_bh + right_oy - offset
-
-    # Composite
-    canvas = base_image.copy()
-    canvas.paste(left_img, (left_x, left_y), left_img)
-    canvas.paste(right_img, (right_x, right_y), right_img)
-
-    # Text overlay
-    text_overlay = get_text_overlay(left_name, right_name)
-    canvas = Image.alpha_composite(canvas, text_overlay)
-
-    # Encode JPEG
+        # Text overlay, blended in place over the characters
+        if text_overlay is not None:
+            overlay_img, overlay_pos = text_overlay
+            canvas.paste(overlay_img, overlay_pos, overlay_img)
+
+        return encode_jpeg(canvas)
+
+    return render
+
+
+def encode_jpeg(canvas: Image.Image) -> bytes:
+    """Encode an RGB canvas as a preview JPEG (libjpeg-turbo when available)."""
+    if turbo_jpeg is not None:
+        return turbo_jpeg.encode(
+            np.asarray(canvas), quality=80, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420,
+        )
     buf = io.BytesIO()
-    canvas.convert("RGB").save(buf, format="JPEG", quality=80)
+    canvas.save(
+        buf, format="JPEG", quality=80, optimize=False, progressive=False, subsampling=2,
+    )
     return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
-# Routes
+# Flask app + routes
 # ---------------------------------------------------------------------------
-@app.route("/")
-def index():
-    return render_template("editor.html")
-
-
-@app.route("/api/characters")
-def api_characters():
-    return jsonify(CHARACTERS)
-
-
-@app.route("/api/page")
-def api_page():
-    character = request.args.get("character", CHARACTERS[0])
-    side = request.args.get("side", "left")
-    resolved = state.resolve(character, side.capitalize())
-    dirty = (character, side.lower()) in state.dirty_pages
-    return jsonify({
-        "character": character,
-        "side": side.lower(),
-        "scale": resolved.get("scale", 1.0),
-        "offset_x": resolved.get("offset_x", 0),
-        "raise": resolved.get("raise", 0),
-        "mirror": bool(resolved.get("mirror")),
-        "use_other_side": bool(resolved.get("use_other_side")),
-        "dirty": dirty,
-    })
-
-
-@app.route("/api/render")
-def api_render():
-    character = request.args.get("character", CHARACTERS[0])
-    side = request.args.get("side", "left")
-    scale = float(request.args.get("scale", 1.0))
-    offset_x = int(float(request.args.get("offset_x", 0)))
-    raise_val = int(float(request.args.get("raise", 0)))
-    flip = request.args.get("flip", "0") == "1"
-    use_other = request.args.get("use_other", "0") == "1"
+def _make_app():
+    """Build the Flask app and register routes (imports Flask lazily)."""
     try:
-        data = render_thumbnail(character, side, scale, offset_x, raise_val, flip, use_other)
-    except Exception as exc:
-        return str(exc), 500
-    return Response(data, mimetype="image/jpeg")
-
-
-@app.route("/api/commit", methods=["POST"])
-def api_commit():
-    body = request.get_json(force=True)
-    character = body["character"]
-    side = body["side"]
-    scale = float(body["scale"])
-    offset_x = int(body["offset_x"])
-    raise_val = int(body["raise"])
-    mirror = bool(body.get("mirror", False))
-    use_other_side = bool(body.get("use_other_side", False))
-    state.set_values(character, side, scale, offset_x, raise_val, mirror, use_other_side)
-    return jsonify({"ok": True})
-
-
-@app.route("/api/save", methods=["POST"])
-def api_save():
-    state.save_to_disk()
-    return jsonify({"ok": True, "message": "Saved to disk"})
-
+        from flask import Flask, Response, jsonify, render_template, request
+    except ImportError:
+        print("error: flask is required (pip install flask)", file=sys.stderr)
+        raise SystemExit(1)
 
-@app.route("/api/reset", methods=["POST"])
-def api_reset():
-    state.reload_from_disk()
-    return jsonify({"ok": True})
+    app = Flask(
+        __name__,
+        template_folder=str(Path(__file__).resolve().parent / "editor_templates"),
+        static_folder=str(Path(__file__).resolve().parent / "editor_static"),
+        static_url_path="/static",
+    )
+    if orjson is not None:
+        from flask.json.provider import JSONProvider
+
+        class OrjsonProvider(JSONProvider):
+            def dumps(self, obj, **kwargs) -> str:
+                return orjson.dumps(obj).decode("utf-8")
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        app.json = OrjsonProvider(app)
+
+    @app.route("/")
+    def index():
+        return render_template("editor.html")
+
+    @app.route("/api/characters")
+    def api_characters():
+        return jsonify(CHARACTERS)
+
+    @app.route("/api/page")
+    def api_page():
+        character = request.args.get("character", CHARACTERS[0])
+        side = request.args.get("side", "left")
+        resolved = state.resolve(character, side.capitalize())
+        dirty = (character, side.lower()) in state.dirty_pages
+        return jsonify({
+            "character": character,
+            "side": side.lower(),
+            "scale": resolved.get("scale", 1.0),
+            "offset_x": resolved.get("offset_x", 0),
+            "raise": resolved.get("raise", 0),
+            "mirror": bool(resolved.get("mirror")),
+            "use_other_side": bool(resolved.get("use_other_side")),
+            "dirty": dirty,
+        })
+
+    @app.route("/api/render")
+    def api_render():
+        character = request.args.get("character", CHARACTERS[0])
+        side = request.args.get("side", "left")
+        scale = float(request.args.get("scale", 1.0))
+        offset_x = int(float(request.args.get("offset_x", 0)))
+        raise_val = int(float(request.args.get("raise", 0)))
+        flip = request.args.get("flip", "0") == "1"
+        use_other = request.args.get("use_other", "0") == "1"
+        preview = request.args.get("preview", "0") == "1"
+        # Output depends only on the query and the working overrides, so
+        # identical slider positions can be answered without rendering.
+        etag = f"{state.etag_salt}-{state.render_generation}-" + hashlib.blake2b(
+            request.query_string, digest_size=8,
+        ).hexdigest()
+        if request.if_none_match.contains(etag):
+            resp = Response(status=304)
+        else:
+            try:
+                data = render_thumbnail(
+                    character, side, scale, offset_x, raise_val, flip, use_other, preview,
+                )
+            except Exception as exc:
+                return str(exc), 500
+            resp = Response(data, mimetype="image/jpeg")
+            resp.content_length = len(data)
+        resp.set_etag(etag)
+        resp.headers["Cache-Control"] = "no-cache"
+        return resp
+
+    @app.route("/api/commit", methods=["POST"])
+    def api_commit():
+        body = request.get_json(force=True)
+        character = body["character"]
+        side = body["side"]
+        scale = float(body["scale"])
+        offset_x = int(body["offset_x"])
+        raise_val = int(body["raise"])
+        mirror = bool(body.get("mirror", False))
+        use_other_side = bool(body.get("use_other_side", False))
+        state.set_values(character, side, scale, offset_x, raise_val, mirror, use_other_side)
+        return jsonify({"ok": True})
+
+    @app.route("/api/save", methods=["POST"])
+    def api_save():
+        state.save_to_disk()
+        return jsonify({"ok": True, "message": "Saved to disk"})
+
+    @app.route("/api/reset", methods=["POST"])
+    def api_reset():
+        state.reload_from_disk()
+        return jsonify({"ok": True})
+
+    return app
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-if __name__ == "__main__":
+def main(argv: list[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in {"-h", "--help"}:
+        # Fast path: no Flask/Pillow imports, no disk scans.
+        print(__doc__.strip())
+        return 0
+
+    app = _make_app()
     init()
     # Open browser after a short delay
     Timer(1.0, lambda: webbrowser.open("http://localhost:5000")).start()
     print("Starting editor at http://localhost:5000")
     app.run(host="127.0.0.1", port=5000, debug=False)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
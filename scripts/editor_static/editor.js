@@ -58,7 +58,7 @@
     valRaise.textContent = String(currentValues.raise);
   }
 
-  function renderUrl() {
+  function renderUrl(isPreview) {
     const char = encodeURIComponent(pageCharacter());
     const side = pageSide();
     const s = currentValues.scale;
@@ -66,31 +66,45 @@
     const r = currentValues.raise;
     return "/api/render?character=" + char + "&side=" + side +
       "&scale=" + s + "&offset_x=" + ox + "&raise=" + r +
-      "&flip=" + (flipped ? "1" : "0") + "&use_other=" + (useOther ? "1" : "0");
+      "&flip=" + (flipped ? "1" : "0") + "&use_other=" + (useOther ? "1" : "0") +
+      (isPreview ? "&preview=1" : "");
   }
 
-  // Throttled image refresh
+  // Throttled image refresh. isPreview=true asks the server for a faster,
+  // lower-quality resize while the user is still dragging/scrolling.
   let renderTimer = null;
   let renderPending = false;
+  let renderPendingPreview = false;
+  let settleTimer = null;
 
-  function requestRender() {
+  function requestRender(isPreview) {
     if (renderTimer) {
       renderPending = true;
+      renderPendingPreview = !!isPreview;
       return;
     }
-    doRender();
+    doRender(!!isPreview);
     renderTimer = setTimeout(function () {
       renderTimer = null;
       if (renderPending) {
         renderPending = false;
-        doRender();
+        doRender(renderPendingPreview);
       }
     }, 40); // ~25fps max
   }
 
-  function doRender() {
+  // Full-quality render once scrolling has stopped for a moment.
+  function scheduleSettleRender() {
+    if (settleTimer) clearTimeout(settleTimer);
+    settleTimer = setTimeout(function () {
+      settleTimer = null;
+      requestRender(false);
+    }, 200);
+  }
+
+  function doRender(isPreview) {
     loadingOverlay.classList.remove("hidden");
-    const url = renderUrl();
+    const url = renderUrl(isPreview);
     const img = new window.Image();
     img.onload = function () {
       preview.src = img.src;
@@ -203,12 +217,13 @@
 
     dirty = true;
     updateUI();
-    requestRender();
+    requestRender(true);
   });
 
   window.addEventListener("mouseup", function (e) {
     if (!dragging) return;
     dragging = false;
+    requestRender(false);
     if (dirty) scheduleAutosave();
   });
 
@@ -219,7 +234,8 @@
     currentValues.scale = Math.round(Math.max(0.3, Math.min(2.0, currentValues.scale + delta)) * 100) / 100;
     dirty = true;
     updateUI();
-    requestRender();
+    requestRender(true);
+    scheduleSettleRender();
     scheduleAutosave();
   }, { passive: false });
 
@@ -18,10 +18,14 @@ def mirror_left_to_right(base_dir: Path, color: str) -> None:
     if Image is None:
         raise RuntimeError("Pillow is required (pip install pillow)")
 
-    image = Image.open(left_path).convert("RGBA")
-    image = image.transpose(Image.FLIP_LEFT_RIGHT)
+    with Image.open(left_path) as source:
+        # transpose() is a single C-level copy; only convert when needed so
+        # RGBA sources (the usual case) aren't copied twice.
+        image = source if source.mode == "RGBA" else source.convert("RGBA")
+        image = image.transpose(Image.FLIP_LEFT_RIGHT)
     right_path.parent.mkdir(parents=True, exist_ok=True)
-    image.save(right_path)
+    # These are committed assets: keep zlib's default level for size.
+    image.save(right_path, "PNG", compress_level=6, optimize=False)
     print(f"ok: wrote {right_path}")
 
 
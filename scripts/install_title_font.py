@@ -2,16 +2,40 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import os
 import shutil
+import stat
+import struct
 import sys
+import tempfile
+import urllib.error
+import urllib.request
 import zipfile
+import zlib
 from pathlib import Path
+from typing import IO, Iterator
 
-from _shared import project_root
+from _shared import json_dumps_pretty, json_loads, project_root
 
 FONT_EXTS = (".ttf", ".otf")
 DEFAULT_DEST_BASE = "assets/fonts/title_font"
+# Preference for picking one face out of a family: (name variants, score).
+WEIGHT_SCORES = (
+    (("regular", "roman"), 4),
+    (("book",), 3),
+    (("medium",), 2),
+    (("bold",), 1),
+    (("italic", "oblique"), -4),
+)
+# Font files run to several MB; copy in large chunks to cut syscalls.
+COPY_BUFFER_SIZE = 1024 * 1024
+URL_PREFIXES = ("http://", "https://")
+# Downloaded zips stay in memory up to this size, then spill to a temp file.
+DOWNLOAD_SPOOL_SIZE = 64 * 1024 * 1024
+# Seconds to wait on a stalled connection or read before giving up.
+DOWNLOAD_TIMEOUT = 30
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -19,7 +43,10 @@ def build_parser() -> argparse.ArgumentParser:
         description="Install a title font from a downloaded zip file.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    parser.add_argument("zip_path", help="Path to the downloaded font zip.")
+    parser.add_argument(
+        "zip_path",
+        help="Path to the downloaded font zip, or an http(s) URL to fetch it from.",
+    )
     parser.add_argument(
         "--font-name",
         help="Substring to pick a specific font file from the zip.",
@@ -32,7 +59,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--delete-zip",
         action="store_true",
-        help="Delete the zip file after installing.",
+        help="Delete the zip file after installing (local paths only).",
+    )
+    parser.add_argument(
+        "--no-verify-crc",
+        dest="verify_crc",
+        action="store_false",
+        help=(
+            "Skip the CRC-32 check while extracting. Saves CPU on large fonts "
+            "but won't catch a corrupted archive; only use for trusted zips."
+        ),
     )
     parser.add_argument(
         "--config",
@@ -45,14 +81,44 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def list_font_entries(zip_file: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
-    entries = []
+def iter_font_entries(zip_file: zipfile.ZipFile) -> Iterator[zipfile.ZipInfo]:
     for info in zip_file.infolist():
-        if info.is_dir():
+        if not info.is_dir() and info.filename.lower().endswith(FONT_EXTS):
+            yield info
+
+
+def list_font_entries(zip_file: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    return list(iter_font_entries(zip_file))
+
+
+def entry_basename(info: zipfile.ZipInfo) -> str:
+    # Zip member names always use "/" separators.
+    return info.filename.rsplit("/", 1)[-1]
+
+
+def entry_suffix(info: zipfile.ZipInfo) -> str:
+    # Only called on font entries, whose names end in a 4-char extension.
+    return info.filename[-4:].lower()
+
+
+def find_exact_font(
+    zip_file: zipfile.ZipFile,
+    name_hint: str | None,
+) -> zipfile.ZipInfo | None:
+    """Look up a hint that names a zip member exactly (with or without extension)."""
+    if not name_hint:
+        return None
+    names = [name_hint]
+    if not name_hint.lower().endswith(FONT_EXTS):
+        names.extend(name_hint + ext for ext in FONT_EXTS)
+    for name in names:
+        try:
+            info = zip_file.getinfo(name)
+        except KeyError:
             continue
-        if Path(info.filename).suffix.lower() in FONT_EXTS:
-            entries.append(info)
-    return entries
+        if not info.is_dir() and info.filename.lower().endswith(FONT_EXTS):
+            return info
+    return None
 
 
 def select_font(
@@ -65,7 +131,7 @@ def select_font(
         candidates = [
             info
             for info in candidates
-            if hint in Path(info.filename).stem.lower() or hint in info.filename.lower()
+            if hint in info.filename.lower()
         ]
     if not candidates:
         return None, []
@@ -73,50 +139,182 @@ def select_font(
         return candidates[0], candidates
 
     def rank(info: zipfile.ZipInfo) -> tuple[int, int, str]:
-        base = Path(info.filename).stem.lower()
-        score = 0
-        if "regular" in base or "roman" in base:
-            score += 4
-        if "book" in base:
-            score += 3
-        if "medium" in base:
-            score += 2
-        if "bold" in base:
-            score += 1
-        if "italic" in base or "oblique" in base:
-            score -= 4
+        base = entry_basename(info).rsplit(".", 1)[0].lower()
+        score = sum(
+            delta
+            for names, delta in WEIGHT_SCORES
+            if any(name in base for name in names)
+        )
         return (-score, len(base), base)
 
     candidates = sorted(candidates, key=rank)
     return candidates[0], candidates
 
 
+def absolute_path(root: Path, value: str) -> Path:
+    # os.path string ops avoid building intermediate Path objects.
+    path = os.path.expanduser(value)
+    if not os.path.isabs(path):
+        path = os.path.join(root, path)
+    return Path(path)
+
+
 def resolve_dest_path(root: Path, value: str, suffix: str) -> Path:
-    dest_path = Path(value).expanduser()
-    if not dest_path.is_absolute():
-        dest_path = root / dest_path
-    if dest_path.exists() and dest_path.is_dir():
+    dest_path = absolute_path(root, value)
+    try:
+        is_dir = stat.S_ISDIR(os.stat(dest_path).st_mode)
+    except OSError:
+        is_dir = False
+    if is_dir:
         return dest_path / f"title_font{suffix}"
-    if dest_path.suffix.lower() not in FONT_EXTS:
+    if not dest_path.name.lower().endswith(FONT_EXTS):
         return dest_path.with_suffix(suffix)
     return dest_path
 
 
+def stored_data_offset(zip_path: Path, info: zipfile.ZipInfo) -> int:
+    """Return the file offset of an entry's raw data (after its local header)."""
+    with zip_path.open("rb") as handle:
+        handle.seek(info.header_offset)
+        header = handle.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"bad local file header for {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    return info.header_offset + zipfile.sizeFileHeader + name_len + extra_len
+
+
+def copy_file_range_all(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Copy `count` bytes from `src_fd` at `offset` in-kernel.
+
+    Uses copy_file_range, falling back to sendfile; raises OSError if neither
+    is usable so the caller can fall back to a userspace copy.
+    """
+    use_copy_file_range = hasattr(os, "copy_file_range")
+    started = False
+    while count > 0:
+        if use_copy_file_range:
+            try:
+                sent = os.copy_file_range(src_fd, dst_fd, count, offset_src=offset)
+            except OSError:
+                # e.g. cross-filesystem on older kernels; retry with sendfile
+                if started:
+                    raise
+                use_copy_file_range = False
+                continue
+        else:
+            sent = os.sendfile(dst_fd, src_fd, offset, count)
+        started = True
+        if sent == 0:
+            raise OSError(f"unexpected end of file at offset {offset}")
+        offset += sent
+        count -= sent
+
+
+def file_crc32(path: Path) -> int:
+    crc = 0
+    with path.open("rb") as handle:
+        while chunk := handle.read(COPY_BUFFER_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def copy_stream(source, target) -> None:
+    """Copy a file object through one reusable buffer."""
+    if not hasattr(source, "readinto"):
+        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+        return
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    while n := source.readinto(buf):
+        target.write(view[:n])
+
+
+def download_zip(url: str) -> IO[bytes]:
+    """Fetch a zip into a spooled temp file without writing it next to the font."""
+    spool = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
+    try:
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            copy_stream(response, spool)
+    except (urllib.error.URLError, TimeoutError, OSError) as exc:
+        spool.close()
+        raise RuntimeError(f"failed to download {url}: {exc}") from exc
+    spool.seek(0)
+    return spool
+
+
+def extract_entry(
+    zip_file: zipfile.ZipFile,
+    zip_path: Path | None,
+    info: zipfile.ZipInfo,
+    dest_path: Path,
+    verify_crc: bool = True,
+) -> None:
+    """Write one zip entry to `dest_path`.
+
+    Stored (uncompressed) entries are a contiguous byte range of the archive,
+    so they are copied in-kernel and then CRC-checked; everything else (and
+    any archive not backed by `zip_path`) streams through zipfile.
+    """
+    if (
+        zip_path is not None
+        and info.compress_type == zipfile.ZIP_STORED
+        and not info.flag_bits & 0x1  # encrypted
+        and hasattr(os, "sendfile")
+    ):
+        offset = stored_data_offset(zip_path, info)
+        try:
+            with zip_path.open("rb") as source, dest_path.open("wb") as target:
+                copy_file_range_all(source.fileno(), target.fileno(), offset, info.file_size)
+        except OSError:
+            pass  # fall through to the buffered copy, which truncates dest
+        else:
+            if verify_crc and file_crc32(dest_path) != info.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+            return
+
+    with zip_file.open(info) as source, dest_path.open("wb") as target:
+        if not verify_crc:
+            # ZipExtFile skips its running CRC when no expected value is set.
+            source._expected_crc = None
+        copy_stream(source, target)
+
+
+# Parsed JSON files keyed by (path, mtime_ns, size); stale entries miss.
+_json_cache: dict[tuple[str, int, int], dict] = {}
+
+
 def load_json_file(path: Path) -> dict:
+    file_stat = path.stat()
+    key = (str(path), file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _json_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json_loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"invalid JSON file {path}: {exc}") from exc
     if not isinstance(payload, dict):
         raise RuntimeError(f"JSON file must be an object: {path}")
+    _json_cache[key] = payload
     return payload
 
 
+def forget_json_file(path: Path) -> None:
+    path_str = str(path)
+    for key in [key for key in _json_cache if key[0] == path_str]:
+        del _json_cache[key]
+
+
 def write_json_file(path: Path, payload: dict) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-        handle.write("\n")
+    # Write beside the target and rename so a crash never leaves a
+    # half-written config behind.
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(json_dumps_pretty(payload))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def parse_targets(raw: str | None) -> list[str] | None:
@@ -131,10 +329,7 @@ def parse_targets(raw: str | None) -> list[str] | None:
 def resolve_config_path(root: Path, value: str | None) -> Path | None:
     if not value:
         return None
-    path = Path(value).expanduser()
-    if not path.is_absolute():
-        path = root / path
-    return path
+    return absolute_path(root, value)
 
 
 def update_config_fonts(
@@ -142,33 +337,52 @@ def update_config_fonts(
     font_path: Path,
     targets: list[str] | None,
     root: Path,
-) -> None:
+) -> bool:
+    """Point the targeted text objects at `font_path`.
+
+    Returns False (and leaves the file untouched) when nothing changed.
+    """
     payload = load_json_file(config_path)
     text_block = payload.get("text")
     if not isinstance(text_block, dict):
         raise RuntimeError(f"event config missing text block: {config_path}")
 
-    if targets is None:
-        keys = [key for key, value in text_block.items() if isinstance(value, dict)]
-    else:
-        keys = targets
-
     try:
         font_value = str(font_path.relative_to(root))
     except ValueError:
         font_value = str(font_path)
 
-    for key in keys:
-        block = text_block.get(key)
-        if not isinstance(block, dict):
-            print(
-                f"warning: text object '{key}' not found in {config_path}",
-                file=sys.stderr,
-            )
-            continue
-        block["font_path"] = font_value
+    if targets is None:
+        blocks = [block for block in text_block.values() if isinstance(block, dict)]
+    else:
+        blocks = []
+        for key in targets:
+            block = text_block.get(key)
+            if not isinstance(block, dict):
+                print(
+                    f"warning: text object '{key}' not found in {config_path}",
+                    file=sys.stderr,
+                )
+                continue
+            blocks.append(block)
+
+    changed = False
+    for block in blocks:
+        if block.get("font_path") != font_value:
+            block["font_path"] = font_value
+            changed = True
+
+    if changed:
+        try:
+            write_json_file(config_path, payload)
+        except Exception:
+            # payload is the cached dict itself; don't let the unsaved edits
+            # stand in for the file that is still on disk.
+            forget_json_file(config_path)
+            raise
+    return changed
+
 
-    write_json_file(config_path, payload)
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -183,25 +397,30 @@ def main(argv: list[str] | None = None) -> int:
         print(f"error: config file not found: {config_path}", file=sys.stderr)
         return 1
 
-    zip_path = Path(args.zip_path).expanduser()
-    if not zip_path.is_absolute():
-        zip_path = root / zip_path
-    if not zip_path.is_file():
-        print(f"error: zip file not found: {zip_path}", file=sys.stderr)
-        return 1
+    zip_url = args.zip_path if args.zip_path.startswith(URL_PREFIXES) else None
+    zip_path: Path | None = None
+    if zip_url is None:
+        zip_path = absolute_path(root, args.zip_path)
+        if not zip_path.is_file():
+            print(f"error: zip file not found: {zip_path}", file=sys.stderr)
+            return 1
+    zip_label = zip_url or zip_path
 
     try:
-        with zipfile.ZipFile(zip_path) as zip_file:
-            entries = list_font_entries(zip_file)
+        source = download_zip(zip_url) if zip_url else contextlib.nullcontext(zip_path)
+        with source as zip_source, zipfile.ZipFile(zip_source) as zip_file:
+            # An exact member name is a dict lookup; substring hints need a scan.
+            exact = find_exact_font(zip_file, args.font_name)
+            entries = [exact] if exact is not None else list_font_entries(zip_file)
             if not entries:
                 print(
-                    f"error: no .ttf or .otf files found in {zip_path}",
+                    f"error: no .ttf or .otf files found in {zip_label}",
                     file=sys.stderr,
                 )
                 return 1
             selected, candidates = select_font(entries, args.font_name)
             if selected is None:
-                available = ", ".join(Path(info.filename).name for info in entries)
+                available = ", ".join(entry_basename(info) for info in entries)
                 print(
                     f"error: no font files matched '{args.font_name}'. "
                     f"Available: {available}",
@@ -210,27 +429,32 @@ def main(argv: list[str] | None = None) -> int:
                 return 1
             if len(candidates) > 1:
                 print(
-                    f"warning: multiple fonts found, using {Path(selected.filename).name}",
+                    f"warning: multiple fonts found, using {entry_basename(selected)}",
                     file=sys.stderr,
                 )
 
-            suffix = Path(selected.filename).suffix.lower()
+            suffix = entry_suffix(selected)
             dest_path = resolve_dest_path(root, args.dest, suffix)
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            with zip_file.open(selected) as source, dest_path.open("wb") as target:
-                shutil.copyfileobj(source, target)
+            extract_entry(zip_file, zip_path, selected, dest_path, args.verify_crc)
             print(f"ok: installed title font to {dest_path}")
             if config_path is not None:
-                update_config_fonts(config_path, dest_path, targets, root)
-                print(f"ok: updated font paths in {config_path}")
+                try:
+                    updated = update_config_fonts(config_path, dest_path, targets, root)
+                except OSError as exc:
+                    raise RuntimeError(f"failed to write {config_path}: {exc}") from exc
+                if updated:
+                    print(f"ok: updated font paths in {config_path}")
+                else:
+                    print(f"ok: font paths already current in {config_path}")
     except zipfile.BadZipFile:
-        print(f"error: invalid zip file: {zip_path}", file=sys.stderr)
+        print(f"error: invalid zip file: {zip_label}", file=sys.stderr)
         return 1
     except RuntimeError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 1
 
-    if args.delete_zip:
+    if args.delete_zip and zip_path is not None:
         try:
             zip_path.unlink()
             print(f"ok: removed {zip_path}")
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+from pathlib import Path
 
 from _shared import (
+    json_loads,
     load_dotenv,
     parse_video_tools_args,
     project_root,
@@ -21,7 +24,15 @@ def build_parser() -> argparse.ArgumentParser:
         description="Generate a channel thumbnail using video_tools.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    parser.add_argument("--title", required=True, help="Main title text")
+    title_group = parser.add_mutually_exclusive_group(required=True)
+    title_group.add_argument("--title", help="Main title text")
+    title_group.add_argument(
+        "--titles-json",
+        help=(
+            "JSON file with a list of {title, subtitle, tagline, slug} objects "
+            "to generate in one run"
+        ),
+    )
     parser.add_argument("--subtitle", help="Secondary title text")
     parser.add_argument("--tagline", help="Optional tagline")
     parser.add_argument(
@@ -29,7 +40,7 @@ def build_parser() -> argparse.ArgumentParser:
         default="output/lunar_thumbnail",
         help="Directory to write metadata JSON",
     )
-    parser.add_argument("--slug", help="Override output file slug")
+    parser.add_argument("--slug", help="Override output file slug (single title only)")
     parser.add_argument(
         "--skip-export",
         action="store_true",
@@ -38,27 +49,34 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args, unknown_args = parser.parse_known_args(argv)
-    video_tools_args = parse_video_tools_args(unknown_args)
-
-    root = project_root()
-    load_dotenv(root / ".env")
-
+def load_titles(path: Path) -> list[dict]:
     try:
-        video_tools_path = require_video_tools_path()
-    except RuntimeError as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 1
+        payload = json_loads(path.read_bytes())
+    except OSError as exc:
+        raise RuntimeError(f"failed to read {path}: {exc}") from exc
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(f"invalid JSON file {path}: {exc}") from exc
+    if not isinstance(payload, list):
+        raise RuntimeError(f"titles JSON must be a list: {path}")
+    for index, entry in enumerate(payload, start=1):
+        if not isinstance(entry, dict) or not entry.get("title"):
+            raise RuntimeError(f"titles JSON entry #{index} needs a title: {path}")
+    return payload
 
-    slug_source = args.slug or args.title
-    slug = slugify(slug_source)
-    output_dir = root / args.output_dir
+
+def build_thumbnail(
+    root: Path,
+    output_dir: Path,
+    entry: dict,
+    video_tools_path: Path,
+    video_tools_args: list[str],
+    skip_export: bool,
+) -> int:
+    slug = slugify(entry.get("slug") or entry["title"])
     metadata_path = output_dir / f"{slug}.json"
 
     export_ran = False
-    if not args.skip_export:
+    if not skip_export:
         export_ran = True
         exit_code = run_video_tools(video_tools_path, video_tools_args, root)
         if exit_code != 0:
@@ -68,9 +86,9 @@ def main(argv: list[str] | None = None) -> int:
         "kind": "lunar_thumbnail",
         "created_at": utc_now(),
         "text": {
-            "title": args.title,
-            "subtitle": args.subtitle,
-            "tagline": args.tagline,
+            "title": entry["title"],
+            "subtitle": entry.get("subtitle"),
+            "tagline": entry.get("tagline"),
         },
         "video_tools": {
             "path": str(video_tools_path),
@@ -85,5 +103,49 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args, unknown_args = parser.parse_known_args(argv)
+    if args.titles_json and args.slug:
+        parser.error("--slug cannot be used with --titles-json")
+    video_tools_args = parse_video_tools_args(unknown_args)
+
+    root = project_root()
+    load_dotenv(root / ".env")
+
+    try:
+        video_tools_path = require_video_tools_path()
+    except RuntimeError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.titles_json:
+        # Batch mode: one process (and one .env/video_tools lookup) for all titles.
+        titles_path = Path(args.titles_json).expanduser()
+        if not titles_path.is_absolute():
+            titles_path = root / titles_path
+        try:
+            entries = load_titles(titles_path)
+        except RuntimeError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+    else:
+        entries = [{
+            "title": args.title,
+            "subtitle": args.subtitle,
+            "tagline": args.tagline,
+            "slug": args.slug,
+        }]
+
+    output_dir = root / args.output_dir
+    for entry in entries:
+        exit_code = build_thumbnail(
+            root, output_dir, entry, video_tools_path, video_tools_args, args.skip_export,
+        )
+        if exit_code != 0:
+            return exit_code
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -7,16 +7,27 @@ import subprocess
 import sys
 from pathlib import Path
 
-from _shared import project_root
+from _shared import json_loads, project_root
 
 DEFAULT_CONFIG_PATH = "configs/quick_set_thumbnail.json"
-REQUIRED_KEYS = {
+REQUIRED_KEYS = frozenset({
     "player1",
     "player2",
     "p1_character",
     "p2_character",
     "round",
-}
+})
+_REQUIRED_KEYS_SORTED = tuple(sorted(REQUIRED_KEYS))
+OPTIONAL_KEYS = (
+    "p1_color",
+    "p2_color",
+    "slug",
+    "output_dir",
+    "character_set",
+    "character_dir",
+    "base_image",
+    "skip_export",
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -29,6 +40,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_CONFIG_PATH,
         help="Path to the set thumbnail config JSON.",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run set_thumbnail in a separate interpreter instead of in-process.",
+    )
     return parser
 
 
@@ -39,8 +55,7 @@ def resolve_path(root: Path, value: str) -> Path:
 
 def load_json_file(path: Path) -> dict:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json_loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"invalid JSON file {path}: {exc}") from exc
     if not isinstance(payload, dict):
@@ -48,14 +63,8 @@ def load_json_file(path: Path) -> dict:
     return payload
 
 
-def build_command(
-    root: Path,
-    script_path: Path,
-    payload: dict,
-) -> list[str]:
-    cmd = [
-        sys.executable,
-        str(script_path),
+def build_argv(payload: dict) -> list[str]:
+    argv = [
         "--player1",
         payload["player1"],
         "--player2",
@@ -68,22 +77,30 @@ def build_command(
         payload["round"],
     ]
     if payload.get("p1_color"):
-        cmd.extend(["--p1-color", payload["p1_color"]])
+        argv.extend(["--p1-color", payload["p1_color"]])
     if payload.get("p2_color"):
-        cmd.extend(["--p2-color", payload["p2_color"]])
+        argv.extend(["--p2-color", payload["p2_color"]])
     if payload.get("slug"):
-        cmd.extend(["--slug", payload["slug"]])
+        argv.extend(["--slug", payload["slug"]])
     if payload.get("output_dir"):
-        cmd.extend(["--output-dir", payload["output_dir"]])
+        argv.extend(["--output-dir", payload["output_dir"]])
     if payload.get("character_set"):
-        cmd.extend(["--character-set", payload["character_set"]])
+        argv.extend(["--character-set", payload["character_set"]])
     if payload.get("character_dir"):
-        cmd.extend(["--character-dir", payload["character_dir"]])
+        argv.extend(["--character-dir", payload["character_dir"]])
     if payload.get("base_image"):
-        cmd.extend(["--base-image", payload["base_image"]])
+        argv.extend(["--base-image", payload["base_image"]])
     if payload.get("skip_export"):
-        cmd.append("--skip-export")
-    return cmd
+        argv.append("--skip-export")
+    return argv
+
+
+def build_command(
+    root: Path,
+    script_path: Path,
+    payload: dict,
+) -> list[str]:
+    return [sys.executable, str(script_path), *build_argv(payload)]
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -102,7 +119,7 @@ def main(argv: list[str] | None = None) -> int:
         print(f"error: {exc}", file=sys.stderr)
         return 1
 
-    missing = [key for key in sorted(REQUIRED_KEYS) if not payload.get(key)]
+    missing = [key for key in _REQUIRED_KEYS_SORTED if not payload.get(key)]
     if missing:
         print(
             f"error: config missing keys: {', '.join(missing)}",
@@ -115,8 +132,17 @@ def main(argv: list[str] | None = None) -> int:
         print(f"error: missing set_thumbnail script at {script_path}", file=sys.stderr)
         return 1
 
-    cmd = build_command(root, script_path, payload)
-    return subprocess.run(cmd, cwd=str(root)).returncode
+    if args.subprocess:
+        cmd = build_command(root, script_path, payload)
+        return subprocess.run(cmd, cwd=str(root)).returncode
+
+    import set_thumbnail
+
+    # Hand the payload over directly rather than round-tripping through argv;
+    # empty optional values fall back to set_thumbnail's defaults as before.
+    options = {key: payload[key] for key in _REQUIRED_KEYS_SORTED}
+    options.update((key, payload[key]) for key in OPTIONAL_KEYS if payload.get(key))
+    return set_thumbnail.run(options)
 
 
 if __name__ == "__main__":
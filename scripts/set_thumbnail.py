@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 try:
     from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
@@ -17,6 +22,7 @@ except ImportError:  # pragma: no cover - handled at runtime
     ImageFont = None
 
 from _shared import (
+    json_loads,
     load_dotenv,
     project_root,
     require_video_tools_path,
@@ -36,8 +42,24 @@ BASE_TEXT_STROKE_WIDTH = 8
 MAX_NAME_LINES = 1
 MAX_UPSCALE = 1.6
 RIGHT_SIDE_HEIGHT_RATIO = 0.9
+DILATE_SHIFT_MAX_RADIUS = 16
 DEFAULT_BASE_IMAGE = "assets/test6.jpg"
 DEFAULT_MAIN_CONFIG = "configs/main.json"
+CHARACTER_SETS = ("vs_screen", "portraits", "stock_icons")
+OVERRIDE_KEYS = ("scale", "offset_x", "raise", "mirror", "use_other_side")
+REQUIRED_OPTIONS = ("player1", "player2", "p1_character", "p2_character", "round")
+# Defaults for the optional options, shared by the CLI and run().
+RUN_DEFAULTS = {
+    "p1_color": "Default",
+    "p2_color": "Default",
+    "output_dir": "output/set_thumbnail",
+    "slug": None,
+    "character_dir": "assets/melee/characters",
+    "character_set": "vs_screen",
+    "base_image": DEFAULT_BASE_IMAGE,
+    "skip_export": False,
+    "fast_png": False,
+}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -45,33 +67,38 @@ def build_parser() -> argparse.ArgumentParser:
         description="Generate a melee set thumbnail using video_tools.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    parser.add_argument("--player1", required=True, help="Left-side player name")
-    parser.add_argument("--player2", required=True, help="Right-side player name")
-    parser.add_argument("--p1-character", required=True, help="Player 1 character name")
-    parser.add_argument("--p2-character", required=True, help="Player 2 character name")
-    parser.add_argument("--p1-color", default="Default", help="Player 1 character color")
-    parser.add_argument("--p2-color", default="Default", help="Player 2 character color")
-    parser.add_argument("--round", required=True, help="Round title")
+    # Required unless --server; main() enforces that.
+    parser.add_argument("--player1", help="Left-side player name")
+    parser.add_argument("--player2", help="Right-side player name")
+    parser.add_argument("--p1-character", help="Player 1 character name")
+    parser.add_argument("--p2-character", help="Player 2 character name")
+    parser.add_argument(
+        "--p1-color", default=RUN_DEFAULTS["p1_color"], help="Player 1 character color"
+    )
+    parser.add_argument(
+        "--p2-color", default=RUN_DEFAULTS["p2_color"], help="Player 2 character color"
+    )
+    parser.add_argument("--round", help="Round title")
     parser.add_argument(
         "--output-dir",
-        default="output/set_thumbnail",
+        default=RUN_DEFAULTS["output_dir"],
         help="Directory to write metadata JSON",
     )
     parser.add_argument("--slug", help="Override output file slug")
     parser.add_argument(
         "--character-dir",
-        default="assets/melee/characters",
+        default=RUN_DEFAULTS["character_dir"],
         help="Base character asset directory",
     )
     parser.add_argument(
         "--character-set",
-        default="vs_screen",
-        choices=("vs_screen", "portraits", "stock_icons"),
+        default=RUN_DEFAULTS["character_set"],
+        choices=CHARACTER_SETS,
         help="Character art set to use",
     )
     parser.add_argument(
         "--base-image",
-        default=DEFAULT_BASE_IMAGE,
+        default=RUN_DEFAULTS["base_image"],
         help="Use an existing base image instead of generating one",
     )
     parser.add_argument(
@@ -79,6 +106,19 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip calling video_tools/thumbnail -e",
     )
+    parser.add_argument(
+        "--fast-png",
+        action="store_true",
+        help="Write the PNG with light compression (bigger file, faster save)",
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help=(
+            "Read one JSON object of options per stdin line and print a JSON "
+            "status line for each; other flags act as per-job defaults"
+        ),
+    )
     return parser
 
 
@@ -93,22 +133,78 @@ def resolve_path(root: Path, value: str | None) -> Path | None:
     return path if path.is_absolute() else root / path
 
 
-def normalize_token(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", text.lower().replace("&", "and"))
+_TOKEN_DROP = bytes(b for b in range(256) if b not in b"abcdefghijklmnopqrstuvwxyz0123456789")
+_HASH_TOKEN_RE = re.compile(r"#\S+")
 
 
-def text_width(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
-    left, top, right, bottom = draw.textbbox((0, 0), text=text, font=font)
+def normalize_token(text: str) -> str:
+    # Keep only ASCII [a-z0-9]: drop non-ASCII on encode, the rest via the table.
+    lowered = text.lower().replace("&", "and")
+    return lowered.encode("ascii", "ignore").translate(None, _TOKEN_DROP).decode("ascii")
+
+
+@lru_cache(maxsize=128)
+def _scan_dir(
+    dir_str: str, mtime_ns: int,
+) -> tuple[dict[str, str], tuple[str, ...], dict[str, str], frozenset[str]]:
+    # mtime_ns is part of the key so adding/removing entries invalidates it.
+    # Token maps keep the first entry in scan order, like the loops they replace.
+    dir_tokens: dict[str, str] = {}
+    dir_names: list[str] = []
+    png_tokens: dict[str, str] = {}
+    png_stems: list[str] = []
+    with os.scandir(dir_str) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                dir_names.append(name)
+                dir_tokens.setdefault(normalize_token(name), name)
+            elif name.endswith(".png") and not name.startswith(".") and entry.is_file():
+                stem = name[:-4]
+                png_stems.append(stem)
+                png_tokens.setdefault(normalize_token(stem), stem)
+    return dir_tokens, tuple(dir_names), png_tokens, frozenset(png_stems)
+
+
+def scan_dir(
+    directory: Path,
+) -> tuple[dict[str, str], tuple[str, ...], dict[str, str], frozenset[str]]:
+    """Return (dir tokens, dir names, png tokens, png stems) for a directory."""
+    return _scan_dir(str(directory), directory.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _text_bbox(font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int, int, int]:
+    # Same box as draw.textbbox((0, 0), ...) on an RGB(A) canvas.  The fitting
+    # loops measure the same strings at the same sizes over and over, so keep
+    # the results; fonts come from _load_font and are reused across calls.
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=256)
+def _load_font(path_str: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path_str, size)
+
+
+def clear_font_caches() -> None:
+    """Forget loaded fonts and measurements (e.g. after a font is reinstalled)."""
+    _load_font.cache_clear()
+    _text_bbox.cache_clear()
+    _fit_text.cache_clear()
+    resolve_config_font_path.cache_clear()
+
+
+def text_width(text: str, font: ImageFont.FreeTypeFont) -> int:
+    left, top, right, bottom = _text_bbox(font, text)
     return right - left
 
 
-def line_height(draw: ImageDraw.ImageDraw, font: ImageFont.FreeTypeFont) -> int:
-    left, top, right, bottom = draw.textbbox((0, 0), text="Ag", font=font)
+def line_height(font: ImageFont.FreeTypeFont) -> int:
+    left, top, right, bottom = _text_bbox(font, "Ag")
     return bottom - top
 
 
 def wrap_text(
-    draw: ImageDraw.ImageDraw,
     text: str,
     font: ImageFont.FreeTypeFont,
     max_width: int,
@@ -120,18 +216,18 @@ def wrap_text(
 
     lines = []
     current = words[0]
-    if text_width(draw, current, font) > max_width:
+    if text_width(current, font) > max_width:
         return None
 
     for word in words[1:]:
         candidate = f"{current} {word}"
-        if text_width(draw, candidate, font) <= max_width:
+        if text_width(candidate, font) <= max_width:
             current = candidate
             continue
 
         lines.append(current)
         current = word
-        if text_width(draw, current, font) > max_width:
+        if text_width(current, font) > max_width:
             return None
         if len(lines) >= max_lines:
             return None
@@ -144,22 +240,41 @@ def wrap_text(
 
 
 def truncate_text(
-    draw: ImageDraw.ImageDraw,
     text: str,
     font: ImageFont.FreeTypeFont,
     max_width: int,
 ) -> str:
-    if text_width(draw, text, font) <= max_width:
+    if text_width(text, font) <= max_width:
         return text
     ellipsis = "..."
     trimmed = text
-    while trimmed and text_width(draw, f"{trimmed}{ellipsis}", font) > max_width:
+    while trimmed and text_width(f"{trimmed}{ellipsis}", font) > max_width:
         trimmed = trimmed[:-1].rstrip()
     return f"{trimmed}{ellipsis}" if trimmed else text
 
 
+def largest_fitting_size(sizes: range, fits: Callable[[int], bool]) -> int | None:
+    """Return the first size in the descending `sizes` for which `fits` holds.
+
+    Width grows with font size, so once a size fits every smaller one does
+    too; that lets a binary search replace the linear shrink loop.  The
+    largest size is tried first since text usually fits without shrinking.
+    """
+    if not sizes:
+        return None
+    if fits(sizes[0]):
+        return sizes[0]
+    lo, hi = 1, len(sizes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if fits(sizes[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return sizes[lo] if lo < len(sizes) else None
+
+
 def fit_text(
-    draw: ImageDraw.ImageDraw,
     text: str,
     font_path: Path,
     max_size: int,
@@ -167,17 +282,38 @@ def fit_text(
     max_width: int,
     max_lines: int,
 ) -> tuple[ImageFont.FreeTypeFont, list[str]]:
-    for size in range(max_size, min_size - 1, -2):
-        font = ImageFont.truetype(str(font_path), size)
-        lines = wrap_text(draw, text, font, max_width, max_lines)
-        if lines is not None:
-            return font, lines
-
-    font = ImageFont.truetype(str(font_path), min_size)
-    lines = wrap_text(draw, text, font, max_width, max_lines)
+    font, lines = _fit_text(text, str(font_path), max_size, min_size, max_width, max_lines)
+    return font, list(lines)
+
+
+@lru_cache(maxsize=1024)
+def _fit_text(
+    text: str,
+    font_path: str,
+    max_size: int,
+    min_size: int,
+    max_width: int,
+    max_lines: int,
+) -> tuple[ImageFont.FreeTypeFont, tuple[str, ...]]:
+    # Batch runs lay out the same names (e.g. the anchor character's player)
+    # with the same block settings again and again.
+    wrapped: dict[int, tuple[ImageFont.FreeTypeFont, list[str] | None]] = {}
+
+    def fits(size: int) -> bool:
+        font = _load_font(font_path, size)
+        wrapped[size] = (font, wrap_text(text, font, max_width, max_lines))
+        return wrapped[size][1] is not None
+
+    size = largest_fitting_size(range(max_size, min_size - 1, -2), fits)
+    if size is not None:
+        font, lines = wrapped[size]
+        return font, tuple(lines)
+
+    font = _load_font(font_path, min_size)
+    lines = wrap_text(text, font, max_width, max_lines)
     if lines is None:
-        lines = [truncate_text(draw, text, font, max_width)]
-    return font, lines
+        lines = [truncate_text(text, font, max_width)]
+    return font, tuple(lines)
 
 
 def draw_text_with_stroke(
@@ -202,16 +338,22 @@ def draw_text_with_stroke(
     except (TypeError, OSError):
         pass
 
-    for dx in range(-stroke_width, stroke_width + 1):
-        for dy in range(-stroke_width, stroke_width + 1):
-            if dx == 0 and dy == 0:
-                continue
-            draw.text(
-                (position[0] + dx, position[1] + dy),
-                text,
-                font=font,
-                fill=stroke_fill,
-            )
+    # No native stroke support: rasterize the text once as a mask, dilate it
+    # by the stroke width (same square reach as offsetting the text in every
+    # direction), stamp that in the stroke color, then draw the fill on top.
+    left, top, right, bottom = _text_bbox(font, text)
+    origin_x = stroke_width - min(0, left)
+    origin_y = stroke_width - min(0, top)
+    mask = Image.new("L", (origin_x + right + stroke_width, origin_y + bottom + stroke_width), 0)
+    ImageDraw.Draw(mask).text((origin_x, origin_y), text, font=font, fill=255)
+    np = load_numpy()
+    if np is not None:
+        # The mask keeps a stroke_width band of zeros on every side, so the
+        # separable dilation matches MaxFilter without its k*k window.
+        stroke_mask = Image.fromarray(dilate_square(np.asarray(mask), stroke_width))
+    else:
+        stroke_mask = mask.filter(ImageFilter.MaxFilter(stroke_width * 2 + 1))
+    draw.bitmap((position[0] - origin_x, position[1] - origin_y), stroke_mask, fill=stroke_fill)
     draw.text(position, text, font=font, fill=fill)
 
 
@@ -220,30 +362,25 @@ def resolve_character_dir(character_root: Path, character: str) -> Path:
     if candidate.is_dir():
         return candidate
 
-    target = normalize_token(character)
-    for path in character_root.iterdir():
-        if path.is_dir() and normalize_token(path.name) == target:
-            return path
+    dir_tokens, dir_names, _, _ = scan_dir(character_root)
+    match = dir_tokens.get(normalize_token(character))
+    if match is not None:
+        return character_root / match
 
-    available = ", ".join(sorted(path.name for path in character_root.iterdir() if path.is_dir()))
+    available = ", ".join(sorted(dir_names))
     raise RuntimeError(f"Unknown character '{character}'. Available: {available}")
 
 
 def find_image_file(character_dir: Path, stem: str) -> Path | None:
-    direct = character_dir / f"{stem}.png"
-    if direct.is_file():
-        return direct
-    target = normalize_token(stem)
-    for path in character_dir.glob("*.png"):
-        if normalize_token(path.stem) == target:
-            return path
-    return None
+    # Exact name first, then the first token match, all from the cached index.
+    _, _, png_tokens, png_stems = scan_dir(character_dir)
+    match = stem if stem in png_stems else png_tokens.get(normalize_token(stem))
+    return character_dir / f"{match}.png" if match is not None else None
 
 
 def available_vs_colors(character_dir: Path) -> list[str]:
     colors: set[str] = set()
-    for path in character_dir.glob("*.png"):
-        stem = path.stem
+    for stem in scan_dir(character_dir)[3]:
         if stem.endswith(" Left") or stem.endswith(" Right"):
             colors.add(stem.rsplit(" ", 1)[0])
     return sorted(colors)
@@ -252,22 +389,68 @@ def available_vs_colors(character_dir: Path) -> list[str]:
 def crop_transparent(image: Image.Image) -> Image.Image:
     if image.mode != "RGBA":
         image = image.convert("RGBA")
-    alpha = image.split()[-1]
-    bbox = alpha.getbbox()
+    try:
+        # Pillow >= 10.1 scans the alpha band in place.
+        bbox = image.getbbox(alpha_only=True)
+    except TypeError:
+        bbox = image.getchannel("A").getbbox()
     return image.crop(bbox) if bbox else image
 
 
-def scale_to_fit(image: Image.Image, max_width: int, max_height: int) -> Image.Image:
+def fit_size(width: int, height: int, max_width: int, max_height: int) -> tuple[int, int]:
+    """Size scale_to_fit would produce for a width x height image."""
     if max_width <= 0 or max_height <= 0:
-        return image
-    scale = min(max_width / image.width, max_height / image.height)
+        return width, height
+    scale = min(max_width / width, max_height / height)
     scale = min(scale, MAX_UPSCALE)
     if scale == 1:
+        return width, height
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def scale_to_fit(image: Image.Image, max_width: int, max_height: int) -> Image.Image:
+    size = fit_size(image.width, image.height, max_width, max_height)
+    if size == image.size:
         return image
-    size = (max(1, int(round(image.width * scale))), max(1, int(round(image.height * scale))))
     return image.resize(size, Image.LANCZOS)
 
 
+@lru_cache(maxsize=1)
+def load_numpy():
+    """numpy if installed, else None.
+
+    Imported on first use (~50 ms) so renders that never dilate don't pay
+    for it; the result, including a failed import, is remembered.
+    """
+    try:
+        import numpy
+    except ImportError:  # optional: faster outline and stroke dilation
+        return None
+    return numpy
+
+
+def dilate_square(alpha: "np.ndarray", radius: int) -> "np.ndarray":
+    """Grey dilation by a (2r+1)-square, as separable row and column passes.
+
+    Equivalent to MaxFilter(2r+1) on an image whose border band is already
+    transparent (as the outline padding guarantees).
+    """
+    np = load_numpy()
+    out = alpha.copy()
+    for axis in (0, 1):
+        src = out.copy()
+        for shift in range(1, radius + 1):
+            if shift >= src.shape[axis]:
+                break
+            lead = [slice(None)] * 2
+            lag = [slice(None)] * 2
+            lead[axis] = slice(shift, None)
+            lag[axis] = slice(None, -shift)
+            np.maximum(out[tuple(lag)], src[tuple(lead)], out=out[tuple(lag)])
+            np.maximum(out[tuple(lead)], src[tuple(lag)], out=out[tuple(lead)])
+    return out
+
+
 def apply_character_outline(image: Image.Image, outline_px: int, color: str) -> Image.Image:
     if outline_px <= 0 or ImageFilter is None:
         return image
@@ -280,9 +463,27 @@ def apply_character_outline(image: Image.Image, outline_px: int, color: str) ->
         (0, 0, 0, 0),
     )
     padded.paste(image, (pad, pad), image)
-    alpha = padded.split()[-1]
+    alpha = padded.getchannel("A")
     filter_size = max(3, pad * 2 + 1)
-    expanded = alpha.filter(ImageFilter.MaxFilter(filter_size))
+    # Same square max (grey dilation) as MaxFilter, run as separable 1-D
+    # passes instead of a k*k window per pixel.  The shifted-maximum passes
+    # cost O(radius) and win for typical outline sizes; scipy's running-max
+    # filter doesn't grow with the radius, so it takes over for wide outlines.
+    # scipy is imported only here: it costs ~150 ms to load and typical
+    # outlines never get this wide.
+    np = load_numpy()
+    ndimage = None
+    if np is not None and pad > DILATE_SHIFT_MAX_RADIUS:
+        try:
+            from scipy import ndimage
+        except ImportError:  # optional: fastest wide-outline dilation
+            ndimage = None
+    if ndimage is not None:
+        expanded = Image.fromarray(ndimage.maximum_filter(np.asarray(alpha), size=filter_size))
+    elif np is not None:
+        expanded = Image.fromarray(dilate_square(np.asarray(alpha), filter_size // 2))
+    else:
+        expanded = alpha.filter(ImageFilter.MaxFilter(filter_size))
     if ImageChops is not None:
         outline_mask = ImageChops.subtract(expanded, alpha)
     else:
@@ -331,18 +532,15 @@ def parse_override_block(block: dict | None, allow_missing: bool = False) -> dic
     return result
 
 
-def merge_overrides(base: dict, extra: dict) -> dict:
-    merged = dict(base)
-    for key in ("scale", "offset_x", "raise", "mirror", "use_other_side"):
+def _merge_override_into(merged: dict, extra: dict) -> None:
+    for key in OVERRIDE_KEYS:
         if key in extra:
             merged[key] = extra[key]
-    return merged
 
 
 def load_json_file(path: Path) -> dict:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json_loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"invalid JSON file {path}: {exc}") from exc
     if not isinstance(payload, dict):
@@ -390,15 +588,27 @@ def load_character_overrides_data(payload: dict | None) -> dict:
     for name, block in (payload.get("characters") or {}).items():
         if not isinstance(block, dict):
             continue
-        entry = {
-            "base": parse_override_block(block),
-            "left": parse_override_block(block.get("left"), allow_missing=True),
-            "right": parse_override_block(block.get("right"), allow_missing=True),
-        }
-        overrides["characters"][normalize_token(name)] = entry
+        overrides["characters"][normalize_token(name)] = parse_character_entry(block)
     return overrides
 
 
+def parse_character_entry(block: dict) -> dict:
+    return {
+        "base": parse_override_block(block),
+        "left": parse_override_block(block.get("left"), allow_missing=True),
+        "right": parse_override_block(block.get("right"), allow_missing=True),
+    }
+
+
+def update_character_override(overrides: dict, character: str, block: dict | None) -> None:
+    """Re-parse one character's raw block in place instead of rebuilding all."""
+    token = normalize_token(character)
+    if isinstance(block, dict):
+        overrides["characters"][token] = parse_character_entry(block)
+    else:
+        overrides["characters"].pop(token, None)
+
+
 def load_character_overrides(path: Path | None) -> dict:
     if path is None:
         return load_character_overrides_data(None)
@@ -415,12 +625,13 @@ def resolve_character_override(overrides: dict, character: str, side: str) -> di
     if not entry:
         return merged
 
-    merged = merge_overrides(merged, entry.get("base", {}))
+    # merged is already a private copy, so layer the blocks onto it in place.
+    _merge_override_into(merged, entry.get("base", {}))
     if side.lower() == "left":
         side_block = entry.get("left", {})
     else:
         side_block = entry.get("right", {})
-    merged = merge_overrides(merged, side_block)
+    _merge_override_into(merged, side_block)
     return merged
 
 
@@ -429,6 +640,7 @@ def apply_character_override(
     override: dict,
     scale_x: float,
     scale_y: float,
+    resample: int | None = None,
 ) -> tuple[Image.Image, int, int]:
     scale = float(override.get("scale", 1.0))
     offset_x = scale_value(int(override.get("offset_x", 0)), scale_x)
@@ -439,13 +651,51 @@ def apply_character_override(
             max(1, int(round(image.width * scale))),
             max(1, int(round(image.height * scale))),
         )
-        image = image.resize(new_size, Image.LANCZOS)
+        image = image.resize(new_size, Image.LANCZOS if resample is None else resample)
     return image, offset_x, offset_y
 
 
+def prepare_character(
+    image: Image.Image,
+    max_width: int,
+    max_height: int,
+    override: dict,
+    scale_x: float,
+    scale_y: float,
+) -> tuple[Image.Image, int, int]:
+    """scale_to_fit followed by apply_character_override, in one resize.
+
+    Output dimensions and offsets match the two-step version; the pixels
+    come from a single LANCZOS pass over the source instead of two.
+    """
+    size = fit_size(image.width, image.height, max_width, max_height)
+    scale = float(override.get("scale", 1.0))
+    if scale != 1.0:
+        size = (max(1, int(round(size[0] * scale))), max(1, int(round(size[1] * scale))))
+    if size != image.size:
+        image = image.resize(size, Image.LANCZOS)
+    offset_x = scale_value(int(override.get("offset_x", 0)), scale_x)
+    offset_y = scale_value(-int(override.get("raise", 0)), scale_y)
+    return image, offset_x, offset_y
+
+
+_warned: set[str] = set()
+
+
+def _warn(message: str) -> None:
+    """Print a warning to stderr once per process.
+
+    Batch runs and the editor resolve the same characters over and over;
+    repeating an identical fallback warning for each render is just noise.
+    """
+    if message in _warned:
+        return
+    _warned.add(message)
+    print(f"warning: {message}", file=sys.stderr)
+
+
 def scaled_height_for_path(path: Path, max_width: int, max_height: int) -> float:
-    image = Image.open(path).convert("RGBA")
-    image = crop_transparent(image)
+    image = load_character_image(path, False)
     scale = min(max_width / image.width, max_height / image.height)
     scale = min(scale, MAX_UPSCALE)
     return image.height * scale
@@ -472,14 +722,8 @@ def resolve_character_image(
                 left_path = find_image_file(character_dir, f"{candidate} Left")
                 if left_path:
                     if normalize_token(candidate) != normalize_token(requested):
-                        print(
-                            f"warning: {character} {side} color '{requested}' not found, using '{candidate}'",
-                            file=sys.stderr,
-                        )
-                    print(
-                        "warning: Roy right side forced to mirrored left asset",
-                        file=sys.stderr,
-                    )
+                        _warn(f"{character} {side} color '{requested}' not found, using '{candidate}'")
+                    _warn("Roy right side forced to mirrored left asset")
                     return left_path, True, candidate
 
         for candidate in candidates:
@@ -487,10 +731,7 @@ def resolve_character_image(
                 path = find_image_file(character_dir, f"{candidate} Left")
                 if path:
                     if normalize_token(candidate) != normalize_token(requested):
-                        print(
-                            f"warning: {character} {side} color '{requested}' not found, using '{candidate}'",
-                            file=sys.stderr,
-                        )
+                        _warn(f"{character} {side} color '{requested}' not found, using '{candidate}'")
                     return path, False, candidate
                 continue
 
@@ -501,29 +742,17 @@ def resolve_character_image(
                 left_height = scaled_height_for_path(left_path, max_width, max_height)
                 if right_height < left_height * RIGHT_SIDE_HEIGHT_RATIO:
                     if normalize_token(candidate) != normalize_token(requested):
-                        print(
-                            f"warning: {character} {side} color '{requested}' not found, using '{candidate}'",
-                            file=sys.stderr,
-                        )
-                    print(
-                        f"warning: {character} {side} asset is smaller than left, using left mirrored",
-                        file=sys.stderr,
-                    )
+                        _warn(f"{character} {side} color '{requested}' not found, using '{candidate}'")
+                    _warn(f"{character} {side} asset is smaller than left, using left mirrored")
                     return left_path, True, candidate
 
             if right_path:
                 if normalize_token(candidate) != normalize_token(requested):
-                    print(
-                        f"warning: {character} {side} color '{requested}' not found, using '{candidate}'",
-                        file=sys.stderr,
-                    )
+                    _warn(f"{character} {side} color '{requested}' not found, using '{candidate}'")
                 return right_path, False, candidate
             if left_path:
                 if normalize_token(candidate) != normalize_token(requested):
-                    print(
-                        f"warning: {character} {side} color '{requested}' not found, using '{candidate}'",
-                        file=sys.stderr,
-                    )
+                    _warn(f"{character} {side} color '{requested}' not found, using '{candidate}'")
                 return left_path, True, candidate
 
         available = ", ".join(available_vs_colors(character_dir))
@@ -536,23 +765,58 @@ def resolve_character_image(
         path = find_image_file(character_dir, candidate)
         if path:
             if normalize_token(candidate) != normalize_token(requested):
-                print(
-                    f"warning: {character} color '{requested}' not found, using '{candidate}'",
-                    file=sys.stderr,
-                )
+                _warn(f"{character} color '{requested}' not found, using '{candidate}'")
             return path, False, candidate
-    available = ", ".join(sorted(path.stem for path in character_dir.glob("*.png")))
+    available = ", ".join(sorted(scan_dir(character_dir)[3]))
     raise RuntimeError(
         f"Missing image for {character} ({color}) in {character_dir}. "
         f"Available colors: {available}"
     )
 
 
-def load_character_image(path: Path, mirror: bool) -> Image.Image:
-    image = Image.open(path).convert("RGBA")
+@lru_cache(maxsize=64)
+def _decode_character(path_str: str, mtime_ns: int, mirror: bool) -> Image.Image:
+    # mtime_ns is part of the key so a replaced asset is decoded again.
     if mirror:
+        return _decode_character(path_str, mtime_ns, False).transpose(Image.FLIP_LEFT_RIGHT)
+    return crop_transparent(Image.open(path_str).convert("RGBA"))
+
+
+def load_character_image(path: Path, mirror: bool) -> Image.Image:
+    """Decode a character PNG cropped to its opaque bounds (cached).
+
+    The returned image is shared between callers; don't modify it in place.
+    """
+    return _decode_character(str(path), path.stat().st_mtime_ns, mirror)
+
+
+def prepare_side(
+    image_path: Path,
+    mirror: bool,
+    do_mirror: bool,
+    override: dict,
+    max_width: int,
+    max_height: int,
+    scale_x: float,
+    scale_y: float,
+    outline_px: int,
+    outline_color: str,
+) -> tuple[Image.Image, int, int, int, int]:
+    """Load, scale and outline one side's character.
+
+    Returns (image, offset_x, offset_y, base_width, base_height) where the
+    base size is measured before the outline pads the image.
+    """
+    image = load_character_image(image_path, mirror)
+    if do_mirror:
         image = image.transpose(Image.FLIP_LEFT_RIGHT)
-    return image
+    image, offset_x, offset_y = prepare_character(
+        image, max_width, max_height, override, scale_x, scale_y
+    )
+    base_width, base_height = image.size
+    if outline_px > 0:
+        image = apply_character_outline(image, outline_px, outline_color)
+    return image, offset_x, offset_y, base_width, base_height
 
 
 def resolve_font_path(video_tools_path: Path) -> Path:
@@ -562,6 +826,7 @@ def resolve_font_path(video_tools_path: Path) -> Path:
     return path
 
 
+@lru_cache(maxsize=64)
 def resolve_config_font_path(root: Path, value: str | None, name: str) -> Path:
     path = resolve_path(root, value)
     if path is None or not path.is_file():
@@ -589,6 +854,36 @@ def text_block_text(block: dict | None) -> str:
     return str(block.get("text", "")).strip()
 
 
+def parse_text_block(
+    block: dict,
+    name: str,
+    default_line_spacing: int,
+    default_stroke_width: int,
+) -> dict:
+    """Read a text block's layout and style values, unscaled."""
+    max_size = int_or_default(block.get("max_size"), 0)
+    if max_size <= 0:
+        raise RuntimeError(f"{name} max_size must be a positive integer")
+    max_width = int_or_default(block.get("max_width"), BASE_WIDTH)
+    return {
+        "font_path": block.get("font_path"),
+        "max_size": max_size,
+        "min_size": int_or_default(block.get("min_size"), max_size),
+        "max_width": max_width if max_width > 0 else BASE_WIDTH,
+        "max_lines": int_or_default(block.get("max_lines"), 1),
+        "align": str(block.get("align", "left")).lower(),
+        "anchor": str(block.get("anchor", "top")).lower(),
+        "fill": str(block.get("fill", "white")),
+        "stroke_fill": str(block.get("stroke_fill", "black")),
+        "stroke_width": int_or_default(block.get("stroke_width"), default_stroke_width),
+        "line_spacing": int_or_default(block.get("line_spacing"), default_line_spacing),
+        "x": int_or_default(block.get("x"), 0),
+        "y": int_or_default(block.get("y"), 0),
+        "stack": bool(block.get("stack")),
+        "stack_gap": int_or_default(block.get("stack_gap"), 0),
+    }
+
+
 def draw_text_block(
     draw: ImageDraw.ImageDraw,
     root: Path,
@@ -609,49 +904,36 @@ def draw_text_block(
         else str(block.get("text", "")).strip()
     )
     segments = block.get("segments")
-    text_source = text
-    event_number_token = ""
-    if text_source:
-        matches = re.findall(r"#\S+", text_source)
-        if matches:
-            event_number_token = matches[-1]
     if isinstance(segments, list) and segments:
-        max_size_base = int_or_default(block.get("max_size"), 0)
-        min_size_base = int_or_default(block.get("min_size"), max_size_base)
-        if max_size_base <= 0:
-            raise RuntimeError(f"{name} max_size must be a positive integer")
-        max_size = scale_value(max_size_base, scale_y)
-        min_size = scale_value(min_size_base, scale_y)
-
-        max_width_base = int_or_default(block.get("max_width"), BASE_WIDTH)
-        if max_width_base <= 0:
-            max_width_base = BASE_WIDTH
-        max_width = scale_value(max_width_base, scale_x)
-
-        align = str(block.get("align", "left")).lower()
-        anchor = str(block.get("anchor", "top")).lower()
-        fill = str(block.get("fill", "white"))
-        stroke_fill = str(block.get("stroke_fill", "black"))
-        stroke_width_base = int_or_default(block.get("stroke_width"), default_stroke_width)
-        line_spacing_base = int_or_default(block.get("line_spacing"), default_line_spacing)
-        stroke_width = max(1, scale_value(stroke_width_base, scale_y))
-        _ = scale_value(line_spacing_base, scale_y)
-
-        x = scale_value(int_or_default(block.get("x"), 0), scale_x)
-        y = scale_value(int_or_default(block.get("y"), 0), scale_y)
-        if block.get("stack") and stack_y is not None:
-            gap = scale_value(int_or_default(block.get("stack_gap"), 0), scale_y)
-            y = stack_y + gap
-
-        base_font_path = resolve_config_font_path(root, block.get("font_path"), name)
+        event_number_token = ""
+        if text:
+            matches = _HASH_TOKEN_RE.findall(text)
+            if matches:
+                event_number_token = matches[-1]
+        spec = parse_text_block(block, name, default_line_spacing, default_stroke_width)
+        max_size = scale_value(spec["max_size"], scale_y)
+        min_size = scale_value(spec["min_size"], scale_y)
+        max_width = scale_value(spec["max_width"], scale_x)
+        align = spec["align"]
+        anchor = spec["anchor"]
+        fill = spec["fill"]
+        stroke_fill = spec["stroke_fill"]
+        stroke_width = max(1, scale_value(spec["stroke_width"], scale_y))
+
+        x = scale_value(spec["x"], scale_x)
+        y = scale_value(spec["y"], scale_y)
+        if spec["stack"] and stack_y is not None:
+            y = stack_y + scale_value(spec["stack_gap"], scale_y)
+
+        base_font_path = resolve_config_font_path(root, spec["font_path"], name)
 
         def build_segments(
             base_size: int,
-        ) -> tuple[int, int, int, list[tuple[str, ImageFont.FreeTypeFont, int, int]]]:
+        ) -> tuple[int, int, int, list[tuple[str, ImageFont.FreeTypeFont, int, int, int]]]:
             total_width = 0
             max_ascent = 0
             max_descent = 0
-            built: list[tuple[str, ImageFont.FreeTypeFont, int, int]] = []
+            built: list[tuple[str, ImageFont.FreeTypeFont, int, int, int]] = []
             for segment in segments:
                 if not isinstance(segment, dict):
                     continue
@@ -668,29 +950,29 @@ def draw_text_block(
                 else:
                     seg_font_path = base_font_path
                 seg_size = max(1, int(round(base_size * seg_scale)))
-                seg_font = ImageFont.truetype(str(seg_font_path), seg_size)
-                seg_width = text_width(draw, seg_text, seg_font)
+                seg_font = _load_font(str(seg_font_path), seg_size)
+                seg_width = text_width(seg_text, seg_font)
                 seg_adjust = scale_value(int_or_default(seg_adjust_base, 0), scale_x)
                 total_width += seg_width + seg_adjust
                 ascent, descent = seg_font.getmetrics()
                 max_ascent = max(max_ascent, ascent)
                 max_descent = max(max_descent, descent)
-                built.append((seg_text, seg_font, seg_width, seg_adjust))
+                built.append((seg_text, seg_font, seg_width, seg_adjust, ascent))
             return total_width, max_ascent, max_descent, built
 
-        chosen = None
-        for size in range(max_size, min_size - 1, -2):
-            total_width, max_ascent, max_descent, built = build_segments(size)
-            if not built:
-                return stack_y
-            if max_width <= 0 or total_width <= max_width:
-                chosen = (total_width, max_ascent, max_descent, built)
-                break
+        measured = {}
 
-        if chosen is None:
-            total_width, max_ascent, max_descent, built = build_segments(min_size)
-        else:
-            total_width, max_ascent, max_descent, built = chosen
+        def segments_fit(size: int) -> bool:
+            measured[size] = build_segments(size)
+            return max_width <= 0 or measured[size][0] <= max_width
+
+        size = largest_fitting_size(range(max_size, min_size - 1, -2), segments_fit)
+        if size is None:
+            size = min_size
+            measured[size] = build_segments(size)
+        total_width, max_ascent, max_descent, built = measured[size]
+        if not built:
+            return stack_y
 
         total_height = max_ascent + max_descent
         if anchor == "center":
@@ -709,9 +991,8 @@ def draw_text_block(
 
         baseline_y = start_y + max_ascent
         current_x = start_x
-        for seg_text, seg_font, seg_width, seg_adjust in built:
-            ascent, _ = seg_font.getmetrics()
-            seg_y = baseline_y - ascent
+        for seg_text, seg_font, seg_width, seg_adjust, seg_ascent in built:
+            seg_y = baseline_y - seg_ascent
             draw_text_with_stroke(
                 draw,
                 (current_x, seg_y),
@@ -728,36 +1009,24 @@ def draw_text_block(
         return stack_y
 
     font_path = resolve_config_font_path(root, block.get("font_path"), name)
-    max_size_base = int_or_default(block.get("max_size"), 0)
-    min_size_base = int_or_default(block.get("min_size"), max_size_base)
-    if max_size_base <= 0:
-        raise RuntimeError(f"{name} max_size must be a positive integer")
-    max_size = scale_value(max_size_base, scale_y)
-    min_size = scale_value(min_size_base, scale_y)
-
-    max_width_base = int_or_default(block.get("max_width"), BASE_WIDTH)
-    if max_width_base <= 0:
-        max_width_base = BASE_WIDTH
-    max_width = scale_value(max_width_base, scale_x)
-    max_lines = int_or_default(block.get("max_lines"), 1)
-
-    align = str(block.get("align", "left")).lower()
-    anchor = str(block.get("anchor", "top")).lower()
-    fill = str(block.get("fill", "white"))
-    stroke_fill = str(block.get("stroke_fill", "black"))
-    stroke_width_base = int_or_default(block.get("stroke_width"), default_stroke_width)
-    line_spacing_base = int_or_default(block.get("line_spacing"), default_line_spacing)
-    stroke_width = max(1, scale_value(stroke_width_base, scale_y))
-    line_spacing = scale_value(line_spacing_base, scale_y)
-
-    x = scale_value(int_or_default(block.get("x"), 0), scale_x)
-    y = scale_value(int_or_default(block.get("y"), 0), scale_y)
-    if block.get("stack") and stack_y is not None:
-        gap = scale_value(int_or_default(block.get("stack_gap"), 0), scale_y)
-        y = stack_y + gap
+    spec = parse_text_block(block, name, default_line_spacing, default_stroke_width)
+    max_size = scale_value(spec["max_size"], scale_y)
+    min_size = scale_value(spec["min_size"], scale_y)
+    max_width = scale_value(spec["max_width"], scale_x)
+    max_lines = spec["max_lines"]
+    align = spec["align"]
+    anchor = spec["anchor"]
+    fill = spec["fill"]
+    stroke_fill = spec["stroke_fill"]
+    stroke_width = max(1, scale_value(spec["stroke_width"], scale_y))
+    line_spacing = scale_value(spec["line_spacing"], scale_y)
+
+    x = scale_value(spec["x"], scale_x)
+    y = scale_value(spec["y"], scale_y)
+    if spec["stack"] and stack_y is not None:
+        y = stack_y + scale_value(spec["stack_gap"], scale_y)
 
     font, lines = fit_text(
-        draw,
         text,
         font_path,
         max_size,
@@ -766,7 +1035,7 @@ def draw_text_block(
         max_lines,
     )
 
-    line_height_px = line_height(draw, font)
+    line_height_px = line_height(font)
     total_height = line_height_px * len(lines) + line_spacing * max(0, len(lines) - 1)
     if anchor == "center":
         start_y = y - (total_height // 2)
@@ -777,7 +1046,7 @@ def draw_text_block(
 
     current_y = start_y
     for line in lines:
-        line_width = text_width(draw, line, font)
+        line_width = text_width(line, font)
         if align == "center":
             line_x = x - (line_width // 2)
         elif align == "right":
@@ -798,12 +1067,10 @@ def draw_text_block(
     return start_y + total_height
 
 
-def text_block_height(
-    draw: ImageDraw.ImageDraw, font: ImageFont.FreeTypeFont, line_count: int, line_spacing: int
-) -> int:
+def text_block_height(font: ImageFont.FreeTypeFont, line_count: int, line_spacing: int) -> int:
     if line_count <= 0:
         return 0
-    return line_height(draw, font) * line_count + line_spacing * max(0, line_count - 1)
+    return line_height(font) * line_count + line_spacing * max(0, line_count - 1)
 
 
 def draw_player_names(
@@ -852,14 +1119,14 @@ def draw_player_names(
     x_padding = scale_value(x_padding_base, scale_x)
     center_gap = scale_value(center_gap_base, scale_x)
     y = scale_value(y_base, scale_y)
+    name_area = (width / 2) - center_gap - x_padding
 
     if max_width_value > 0:
         name_max_width = scale_value(max_width_value, scale_x)
     else:
-        name_max_width = int(max(1, round((width / 2) - center_gap - x_padding)))
+        name_max_width = int(max(1, round(name_area)))
 
     left_font, left_lines = fit_text(
-        draw,
         left_text,
         font_path,
         max_size,
@@ -868,7 +1135,6 @@ def draw_player_names(
         max_lines,
     )
     right_font, right_lines = fit_text(
-        draw,
         right_text,
         font_path,
         max_size,
@@ -877,8 +1143,8 @@ def draw_player_names(
         max_lines,
     )
 
-    left_height = text_block_height(draw, left_font, len(left_lines), line_spacing)
-    right_height = text_block_height(draw, right_font, len(right_lines), line_spacing)
+    left_height = text_block_height(left_font, len(left_lines), line_spacing)
+    right_height = text_block_height(right_font, len(right_lines), line_spacing)
     max_height = max(left_height, right_height)
 
     left_y = y + (max_height - left_height) // 2
@@ -886,75 +1152,109 @@ def draw_player_names(
     fill = str(block.get("fill", "white"))
     stroke_fill = str(block.get("stroke_fill", "black"))
 
+    # Each side is (font, lines, top, anchor x, share of the line width to
+    # the left of the anchor): centered names straddle their anchor, edge
+    # names hang right of the left padding or left of the right one.
     if align == "center":
-        left_center = x_padding + ((width / 2) - center_gap - x_padding) / 2
-        right_center = (width / 2) + center_gap + ((width / 2) - center_gap - x_padding) / 2
-
-        current_y = left_y
-        for line in left_lines:
-            line_width = text_width(draw, line, left_font)
-            draw_text_with_stroke(
-                draw,
-                (int(round(left_center - (line_width / 2))), current_y),
-                line,
-                left_font,
-                fill,
-                stroke_fill,
-                stroke_width,
-            )
-            current_y += line_height(draw, left_font) + line_spacing
-
-        current_y = right_y
-        for line in right_lines:
-            line_width = text_width(draw, line, right_font)
-            draw_text_with_stroke(
-                draw,
-                (int(round(right_center - (line_width / 2))), current_y),
-                line,
-                right_font,
-                fill,
-                stroke_fill,
-                stroke_width,
-            )
-            current_y += line_height(draw, right_font) + line_spacing
+        left_anchor, left_share = x_padding + name_area / 2, 0.5
+        right_anchor, right_share = (width / 2) + center_gap + name_area / 2, 0.5
     else:
-        left_x = x_padding
-        current_y = left_y
-        for line in left_lines:
-            draw_text_with_stroke(
-                draw,
-                (left_x, current_y),
-                line,
-                left_font,
-                fill,
-                stroke_fill,
-                stroke_width,
-            )
-            current_y += line_height(draw, left_font) + line_spacing
-
-        right_x = width - x_padding
-        current_y = right_y
-        for line in right_lines:
-            line_width = text_width(draw, line, right_font)
+        left_anchor, left_share = x_padding, 0
+        right_anchor, right_share = width - x_padding, 1
+    sides = (
+        (left_font, left_lines, left_y, left_anchor, left_share),
+        (right_font, right_lines, right_y, right_anchor, right_share),
+    )
+    for font, lines, current_y, anchor_x, share in sides:
+        step = line_height(font) + line_spacing
+        for line in lines:
+            line_x = int(round(anchor_x - text_width(line, font) * share))
             draw_text_with_stroke(
                 draw,
-                (right_x - line_width, current_y),
+                (line_x, current_y),
                 line,
-                right_font,
+                font,
                 fill,
                 stroke_fill,
                 stroke_width,
             )
-            current_y += line_height(draw, right_font) + line_spacing
+            current_y += step
 
 
 def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    options = vars(args)
+    server = options.pop("server")
+    if server:
+        return serve({key: value for key, value in options.items() if value is not None})
+    missing = [key for key in REQUIRED_OPTIONS if options[key] is None]
+    if missing:
+        flags = ", ".join(f"--{key.replace('_', '-')}" for key in missing)
+        parser.error(f"the following arguments are required: {flags}")
+    return run(options)
+
+
+def serve(defaults: dict) -> int:
+    """Run one job per JSON line on stdin, writing a JSON status line for each.
+
+    The process stays warm between jobs, so fonts, text layouts and decoded
+    characters remain cached.  run()'s own messages go to stderr to keep
+    stdout to status lines only.
+    """
+    failures = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        status = serve_job(line, defaults)
+        if not status["ok"]:
+            failures += 1
+        sys.stdout.write(json.dumps(status) + "\n")
+        sys.stdout.flush()
+    return 1 if failures else 0
+
+
+def serve_job(line: str, defaults: dict) -> dict:
+    try:
+        job = json_loads(line.encode("utf-8"))
+    except json.JSONDecodeError as exc:
+        return {"ok": False, "error": f"invalid JSON: {exc}"}
+    if not isinstance(job, dict):
+        return {"ok": False, "error": "job must be a JSON object"}
+    options = {**defaults, **job}
+    missing = [key for key in REQUIRED_OPTIONS if not options.get(key)]
+    if missing:
+        return {"ok": False, "error": f"job missing keys: {', '.join(missing)}"}
+    not_strings = [key for key in REQUIRED_OPTIONS if not isinstance(options[key], str)]
+    if not_strings:
+        return {"ok": False, "error": f"job keys must be strings: {', '.join(not_strings)}"}
+    # One bad job must not take the server (and every queued job) down with it.
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            code = run(options)
+    except Exception as exc:
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    return {"ok": code == 0, "returncode": code}
+
+
+def run(config: dict) -> int:
+    """Generate a thumbnail from options keyed like the CLI's argument names.
+
+    Optional keys fall back to RUN_DEFAULTS; callers must supply player1,
+    player2, p1_character, p2_character and round.
+    """
     if Image is None or ImageDraw is None or ImageFont is None:
         print("error: Pillow is required (pip install pillow)", file=sys.stderr)
         return 1
 
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = argparse.Namespace(**{**RUN_DEFAULTS, **config})
+    if args.character_set not in CHARACTER_SETS:
+        print(
+            f"error: unknown character set '{args.character_set}' "
+            f"(choose from {', '.join(CHARACTER_SETS)})",
+            file=sys.stderr,
+        )
+        return 1
 
     root = project_root()
     load_dotenv(root / ".env")
@@ -1060,8 +1360,12 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     outline_config = parse_character_outline_config(event_config.get("character_outline"))
-    base_image = Image.open(base_image_path).convert("RGBA")
-    width, height = base_image.size
+    # The base is opened just for this render, so composite straight onto it;
+    # convert() would only copy a base that is already RGBA.
+    canvas = Image.open(base_image_path)
+    if canvas.mode != "RGBA":
+        canvas = canvas.convert("RGBA")
+    width, height = canvas.size
     scale_x = width / BASE_WIDTH
     scale_y = height / BASE_HEIGHT
     outline_px = 0
@@ -1117,39 +1421,32 @@ def main(argv: list[str] | None = None) -> int:
         print(f"error: {exc}", file=sys.stderr)
         return 1
 
-    p1_image = load_character_image(p1_image_path, p1_mirror)
-    if p1_do_mirror:
-        p1_image = p1_image.transpose(Image.FLIP_LEFT_RIGHT)
-    p1_image = crop_transparent(p1_image)
-    p1_image = scale_to_fit(p1_image, character_max_width, character_max_height)
-    p1_image, p1_offset_x, p1_offset_y = apply_character_override(
-        p1_image, p1_override, scale_x, scale_y
-    )
-
-    p2_image = load_character_image(p2_image_path, p2_mirror)
-    if p2_do_mirror:
-        p2_image = p2_image.transpose(Image.FLIP_LEFT_RIGHT)
-    p2_image = crop_transparent(p2_image)
-    p2_image = scale_to_fit(p2_image, character_max_width, character_max_height)
-    p2_image, p2_offset_x, p2_offset_y = apply_character_override(
-        p2_image, p2_override, scale_x, scale_y
-    )
-
-    p1_base_width = p1_image.width
-    p1_base_height = p1_image.height
-    p2_base_width = p2_image.width
-    p2_base_height = p2_image.height
+    # Both sides are independent and the heavy work (decode, resize,
+    # outline) runs in Pillow/numpy C code that releases the GIL.
     outline_offset = outline_px if outline_px > 0 else 0
-    if outline_offset:
-        p1_image = apply_character_outline(p1_image, outline_offset, outline_color)
-        p2_image = apply_character_outline(p2_image, outline_offset, outline_color)
+    side_args = (
+        character_max_width,
+        character_max_height,
+        scale_x,
+        scale_y,
+        outline_offset,
+        outline_color,
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        p1_future = executor.submit(
+            prepare_side, p1_image_path, p1_mirror, p1_do_mirror, p1_override, *side_args
+        )
+        p2_future = executor.submit(
+            prepare_side, p2_image_path, p2_mirror, p2_do_mirror, p2_override, *side_args
+        )
+        p1_image, p1_offset_x, p1_offset_y, p1_base_width, p1_base_height = p1_future.result()
+        p2_image, p2_offset_x, p2_offset_y, p2_base_width, p2_base_height = p2_future.result()
 
     p1_x = border + margin_x + p1_offset_x - outline_offset
     p1_y = height - border - margin_y - p1_base_height + p1_offset_y - outline_offset
     p2_x = width - border - margin_x - p2_base_width + p2_offset_x - outline_offset
     p2_y = height - border - margin_y - p2_base_height + p2_offset_y - outline_offset
 
-    canvas = base_image.copy()
     canvas.paste(p1_image, (p1_x, p1_y), p1_image)
     canvas.paste(p2_image, (p2_x, p2_y), p2_image)
 
@@ -1213,7 +1510,10 @@ def main(argv: list[str] | None = None) -> int:
         BASE_TEXT_STROKE_WIDTH,
     )
 
-    canvas.convert("RGB").save(output_path)
+    if args.fast_png:
+        canvas.convert("RGB").save(output_path, compress_level=1)
+    else:
+        canvas.convert("RGB").save(output_path)
 
     print(f"ok: wrote thumbnail to {output_path}")
     if export_ran:
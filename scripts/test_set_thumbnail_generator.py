@@ -3,24 +3,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import random
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from _shared import slugify
+from _shared import json_loads, slugify
 OUTPUT_PREFIX = "set_thumbnail_test_"
-REQUIRED_KEYS = {
+REQUIRED_KEYS = frozenset({
     "round",
     "player1",
     "player2",
     "p1_character",
     "p2_character",
-}
+})
+_REQUIRED_KEYS_SORTED = tuple(sorted(REQUIRED_KEYS))
 DEFAULT_EVENT_TITLE = "Event Title #54"
 DEFAULT_MAIN_CONFIG = "configs/main.json"
 DEFAULT_ANCHOR_CHARACTER = "Fox"
+OPTIONAL_KEYS = ("p1_color", "p2_color", "slug", "character_set", "character_dir")
+_TOKEN_DROP = bytes(b for b in range(256) if b not in b"abcdefghijklmnopqrstuvwxyz0123456789")
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,6 +53,17 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Random seed (overrides test_sets.json)",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each set in a separate interpreter instead of in-process",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="How many --subprocess thumbnails to render at once",
+    )
     return parser.parse_args()
 
 
@@ -57,7 +73,9 @@ def resolve_path(root: Path, value: str) -> Path:
 
 
 def normalize_token(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", text.lower().replace("&", "and"))
+    # Keep only ASCII [a-z0-9]: drop non-ASCII on encode, the rest via the table.
+    lowered = text.lower().replace("&", "and")
+    return lowered.encode("ascii", "ignore").translate(None, _TOKEN_DROP).decode("ascii")
 
 
 def resolve_character_name(characters: list[str], requested: str) -> str | None:
@@ -70,8 +88,7 @@ def resolve_character_name(characters: list[str], requested: str) -> str | None:
 
 def load_json_file(path: Path) -> dict:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json_loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"invalid JSON file {path}: {exc}") from exc
     if not isinstance(payload, dict):
@@ -80,9 +97,7 @@ def load_json_file(path: Path) -> dict:
 
 
 def write_json_file(path: Path, payload: dict) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-        handle.write("\n")
+    path.write_bytes((json.dumps(payload, indent=2) + "\n").encode("utf-8"))
 
 
 def load_main_config(root: Path) -> dict:
@@ -141,7 +156,7 @@ def next_output_dir(output_root: Path) -> Path:
 
 
 def validate_set(payload: dict, index: int) -> bool:
-    missing = sorted(key for key in REQUIRED_KEYS if key not in payload)
+    missing = [key for key in _REQUIRED_KEYS_SORTED if key not in payload]
     if missing:
         print(
             f"error: test set #{index} missing keys: {', '.join(missing)}",
@@ -151,10 +166,15 @@ def validate_set(payload: dict, index: int) -> bool:
     return True
 
 
+def png_stems(character_dir: Path) -> list[str]:
+    # Plain name checks on one scandir; glob would build a Path per entry.
+    with os.scandir(character_dir) as entries:
+        return [entry.name[:-4] for entry in entries if entry.name.endswith(".png")]
+
+
 def available_vs_colors(character_dir: Path) -> list[str]:
     colors: set[str] = set()
-    for path in character_dir.glob("*.png"):
-        stem = path.stem
+    for stem in png_stems(character_dir):
         if stem.endswith(" Left") or stem.endswith(" Right"):
             colors.add(stem.rsplit(" ", 1)[0])
     return sorted(colors)
@@ -163,7 +183,7 @@ def available_vs_colors(character_dir: Path) -> list[str]:
 def available_colors(character_dir: Path, character_set: str) -> list[str]:
     if character_set == "vs_screen":
         return available_vs_colors(character_dir)
-    return sorted({path.stem for path in character_dir.glob("*.png")})
+    return sorted(set(png_stems(character_dir)))
 
 
 def load_character_pool(
@@ -252,6 +272,29 @@ def build_random_sets(
     return sets, defaults
 
 
+def merge_set(payload: dict, defaults: dict | None = None) -> dict:
+    merged = {}
+    if defaults:
+        merged.update(defaults)
+    merged.update(payload)
+    return merged
+
+
+def build_options(
+    root: Path,
+    output_dir: Path,
+    payload: dict,
+    defaults: dict | None = None,
+) -> dict:
+    """set_thumbnail.run options equivalent to build_command's flags."""
+    merged = merge_set(payload, defaults)
+    options = {key: merged[key] for key in _REQUIRED_KEYS_SORTED}
+    options.update((key, merged[key]) for key in OPTIONAL_KEYS if merged.get(key))
+    options["output_dir"] = str(output_dir.relative_to(root))
+    options["fast_png"] = True
+    return options
+
+
 def build_command(
     root: Path,
     script_path: Path,
@@ -259,10 +302,7 @@ def build_command(
     payload: dict,
     defaults: dict | None = None,
 ) -> list[str]:
-    merged = {}
-    if defaults:
-        merged.update(defaults)
-    merged.update(payload)
+    merged = merge_set(payload, defaults)
     relative_output = output_dir.relative_to(root)
     cmd = [
         sys.executable,
@@ -279,6 +319,7 @@ def build_command(
         merged["round"],
         "--output-dir",
         str(relative_output),
+        "--fast-png",
     ]
     if merged.get("p1_color"):
         cmd.extend(["--p1-color", merged["p1_color"]])
@@ -303,8 +344,7 @@ def main() -> int:
         return 1
 
     try:
-        with sets_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = json_loads(sets_path.read_bytes())
     except json.JSONDecodeError as exc:
         print(f"error: invalid JSON in {sets_path}: {exc}", file=sys.stderr)
         return 1
@@ -356,6 +396,7 @@ def main() -> int:
     print(f"ok: writing thumbnails to {output_dir}")
 
     failures = 0
+    entries: list[tuple[int, dict]] = []
     for index, entry in enumerate(sets, start=1):
         if not isinstance(entry, dict):
             print(f"error: test set #{index} must be an object", file=sys.stderr)
@@ -364,10 +405,45 @@ def main() -> int:
         if not validate_set(entry, index):
             failures += 1
             continue
-
-        cmd = build_command(root, script_path, output_dir, entry, defaults)
-        result = subprocess.run(cmd, cwd=str(root))
-        if result.returncode != 0:
+        entries.append((index, entry))
+
+    if args.subprocess:
+        # Each set is its own set_thumbnail process and the event config was
+        # written above, so the runs share nothing; threads just wait on them.
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = [
+                (
+                    index,
+                    executor.submit(
+                        subprocess.run,
+                        build_command(root, script_path, output_dir, entry, defaults),
+                        cwd=str(root),
+                    ),
+                )
+                for index, entry in entries
+            ]
+            results = [(index, future.result().returncode) for index, future in futures]
+    else:
+        import set_thumbnail
+
+        # One interpreter for the whole batch keeps fonts, text metrics and
+        # decoded characters cached between sets.  Sets run one at a time:
+        # the cached FreeType faces aren't safe to share across threads.
+        results = []
+        for index, entry in entries:
+            # A crash counts as one failed set, as a crashing subprocess would.
+            try:
+                returncode = set_thumbnail.run(build_options(root, output_dir, entry, defaults))
+            except Exception as exc:
+                print(
+                    f"error: test set #{index} raised {type(exc).__name__}: {exc}",
+                    file=sys.stderr,
+                )
+                returncode = 1
+            results.append((index, returncode))
+
+    for index, returncode in results:
+        if returncode != 0:
             failures += 1
             print(f"error: test set #{index} failed", file=sys.stderr)
 
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import set_thumbnail as st  # noqa: E402
+from PIL import Image, ImageDraw, ImageFont  # noqa: E402
+
+FONT_PATH = Path(__file__).resolve().parents[1] / "assets" / "fonts" / "title_font.otf"
+
+
+class NoNativeStroke(ImageDraw.ImageDraw):
+    """Draw that refuses stroke_width, like Pillow builds without stroke support."""
+
+    def text(self, xy, text, *args, stroke_width=0, **kwargs):
+        if stroke_width:
+            raise TypeError("stroke_width not supported")
+        return super().text(xy, text, *args, **kwargs)
+
+
+def sample_character() -> Image.Image:
+    image = Image.new("RGBA", (120, 90), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((20, 15, 95, 75), fill=(200, 30, 30, 255))
+    draw.rectangle((5, 40, 30, 50), fill=(30, 200, 30, 128))
+    return image
+
+
+def render_stroked_text() -> Image.Image:
+    canvas = Image.new("RGBA", (700, 180), (40, 90, 160, 255))
+    font = ImageFont.truetype(str(FONT_PATH), 90)
+    st.draw_text_with_stroke(NoNativeStroke(canvas), (20, 20), "Fox #54", font, "white", "black", 6)
+    return canvas
+
+
+def same_pixels(a: Image.Image, b: Image.Image) -> bool:
+    return a.mode == b.mode and a.size == b.size and a.tobytes() == b.tobytes()
+
+
+class WithoutNumpyTests(unittest.TestCase):
+    def test_outline_falls_back_to_max_filter(self) -> None:
+        image = sample_character()
+        for radius in (1, 3, 8):
+            with mock.patch.object(st, "load_numpy", return_value=None):
+                fallback = st.apply_character_outline(image, radius, "#000000")
+            self.assertEqual(fallback.size, (image.width + radius * 2, image.height + radius * 2))
+            if st.load_numpy() is not None:
+                vectorized = st.apply_character_outline(image, radius, "#000000")
+                self.assertTrue(same_pixels(fallback, vectorized), f"radius {radius}")
+
+    @unittest.skipUnless(FONT_PATH.is_file(), "title font not installed")
+    def test_stroke_falls_back_to_max_filter(self) -> None:
+        with mock.patch.object(st, "load_numpy", return_value=None):
+            fallback = render_stroked_text()
+        blank = Image.new("RGBA", fallback.size, (40, 90, 160, 255))
+        self.assertFalse(same_pixels(fallback, blank))
+        if st.load_numpy() is not None:
+            self.assertTrue(same_pixels(fallback, render_stroked_text()))
+
+
+if __name__ == "__main__":
+    unittest.main()